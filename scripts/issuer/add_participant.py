@@ -68,13 +68,6 @@ except ImportError:
     psycopg2 = None
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -378,6 +371,12 @@ def load_config_from_env() -> Dict[str, Any]:
 
 def main() -> int:
     """Main entry point for participant addition script."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
     parser = argparse.ArgumentParser(
         description="Add participant to Issuer Service",
         formatter_class=argparse.RawDescriptionHelpFormatter,
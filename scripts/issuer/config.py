@@ -22,12 +22,6 @@ import sys
 import urllib.parse
 from typing import Dict, Optional
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -317,6 +311,12 @@ def load_config() -> Optional[Config]:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
     config = load_config()
     if config:
         logger.info("Configuration loaded and validated successfully")
@@ -99,6 +99,10 @@ def create_all_attestations(config: Config) -> bool:
 
 def main() -> int:
     """Main entry point for attestation creation script."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     logger.info("=" * 60)
     logger.info("Issuer Service - Create Attestation Definitions")
     logger.info("=" * 60)
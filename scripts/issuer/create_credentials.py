@@ -138,6 +138,10 @@ def create_all_credentials(config: Config) -> bool:
 
 def main() -> int:
     """Main entry point for credential definition creation script."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     logger.info("=" * 60)
     logger.info("Issuer Service - Create Credential Definitions")
     logger.info("=" * 60)
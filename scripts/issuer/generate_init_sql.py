@@ -16,23 +16,10 @@ Output:
 """
 
 import logging
-import os
 import sys
 from pathlib import Path
 
-# Add the scripts directory to the path to import config
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-try:
-    from issuer.config import load_config
-except ImportError:
-    print("ERROR: Could not import issuer config")
-    print("Make sure you're running from the project root directory")
-    sys.exit(1)
-
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from config import load_config
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +85,10 @@ def write_init_sql(config) -> bool:
 
 def main():
     """Main entry point."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     logger.info("Generating Issuer Database Initialization SQL")
     logger.info("=" * 60)
 
@@ -1,21 +1,190 @@
-"""HTTP utilities for Issuer Service API interactions."""
+"""HTTP utilities for Issuer Service API interactions.
 
+Requests are sent over persistent (keep-alive) connections kept per thread and
+per host, so the many sequential seeding calls to the Issuer APIs reuse the
+same TCP connection instead of opening a new one for every request. Proxies
+configured in the environment (HTTP_PROXY, HTTPS_PROXY, NO_PROXY) are used,
+and redirects of GET and HEAD requests are followed, as urllib did.
+"""
+
+import functools
+import http.client
 import json
 import logging
-import urllib.error
+import threading
+import urllib.parse
 import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
 from config import HTTP_TIMEOUT_SECONDS
 
 logger = logging.getLogger(__name__)
 
+# Methods that are safe to send again on a fresh connection after the
+# response was lost
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Redirect responses followed for GET and HEAD requests. Other methods get
+# the 3xx response back, since resending their body elsewhere is not safe.
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+
+# Per-thread pool of open connections keyed by (scheme, netloc).
+# http.client connections are not thread-safe, so each thread keeps its own.
+_connections = threading.local()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_proxy(scheme: str, netloc: str) -> Optional[Tuple[str, Optional[int]]]:
+    """Look up the environment proxy (host, port) for a host, or None if direct."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(netloc):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    parsed = urllib.parse.urlsplit(proxy)
+    return parsed.hostname, parsed.port
+
+
+def _get_connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    """Get the calling thread's pooled connection for a host, creating it if needed."""
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        proxy = _get_proxy(scheme, netloc)
+        if proxy is None:
+            host, port = netloc, None
+        else:
+            host, port = proxy
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                host, port, timeout=HTTP_TIMEOUT_SECONDS
+            )
+            if proxy is not None:
+                conn.set_tunnel(netloc)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=HTTP_TIMEOUT_SECONDS)
+        pool[(scheme, netloc)] = conn
+    return conn
+
+
+@functools.lru_cache(maxsize=128)
+def _split_url(url: str) -> Tuple[str, str, str]:
+    """Split a URL into (scheme, netloc, path with query), caching the result."""
+    parsed = urllib.parse.urlsplit(url)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    return parsed.scheme, parsed.netloc, path
+
+
+def _send_once(
+    url: str,
+    method: str,
+    headers: Optional[Dict[str, str]],
+    body: Optional[bytes],
+) -> Tuple[int, str, Optional[str], bytes]:
+    """
+    Send a single HTTP request over a pooled keep-alive connection.
+
+    A request on a reused connection that the server has already closed is
+    sent again once on a fresh connection, if the request could not be
+    written or is idempotent. A non-idempotent request whose response was
+    lost may already have been processed, so the error is raised instead.
+
+    Args:
+        url: Target URL
+        method: HTTP method
+        headers: HTTP headers
+        body: Optional request body (already encoded)
+
+    Returns:
+        Tuple of (status_code, reason, location_header, response_body)
+    """
+    scheme, netloc, path = _split_url(url)
+    if scheme == "http" and _get_proxy(scheme, netloc) is not None:
+        # Plain HTTP proxies expect the absolute URL as the request target
+        path = f"http://{netloc}{path}"
+
+    while True:
+        conn = _get_connection(scheme, netloc)
+        reused = conn.sock is not None
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            sent = True
+            response = conn.getresponse()
+            data = response.read()
+            return (
+                response.status,
+                response.reason,
+                response.getheader("Location"),
+                data,
+            )
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            conn.close()
+            if not reused or (sent and method not in IDEMPOTENT_METHODS):
+                raise
+            logger.debug(f"Stale connection to {netloc}, reconnecting")
+        except Exception:
+            conn.close()
+            raise
+
+
+def send_request(
+    url: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    body: Optional[bytes] = None,
+) -> Tuple[int, str, bytes]:
+    """
+    Send an HTTP request, reusing pooled keep-alive connections.
+
+    Redirects of GET and HEAD requests are followed up to MAX_REDIRECTS hops;
+    for other methods, or once the limit is reached, the 3xx response is
+    returned to the caller.
+
+    Args:
+        url: Target URL
+        method: HTTP method
+        headers: HTTP headers
+        body: Optional request body (already encoded)
+
+    Returns:
+        Tuple of (status_code, reason, response_body)
+
+    Raises:
+        OSError: On connection errors and timeouts
+        http.client.HTTPException: On malformed HTTP responses
+    """
+    for _ in range(MAX_REDIRECTS):
+        status, reason, location, data = _send_once(url, method, headers, body)
+        if (
+            status not in REDIRECT_STATUSES
+            or not location
+            or method not in ("GET", "HEAD")
+        ):
+            break
+        url = urllib.parse.urljoin(url, location)
+        logger.debug(f"Following {status} redirect to {url}")
+    else:
+        status, reason, _, data = _send_once(url, method, headers, body)
+
+    return status, reason, data
+
 
 def make_request(
     url: str,
     headers: Dict[str, str],
     method: str = "GET",
-    data: Optional[Dict[str, Any]] = None,
+    data: Optional[Union[Dict[str, Any], bytes]] = None,
     entity_name: str = "resource",
 ) -> tuple[bool, Optional[str], Optional[int]]:
     """
@@ -25,7 +194,8 @@ def make_request(
         url: Target URL
         headers: HTTP headers
         method: HTTP method (GET, POST, etc.)
-        data: Optional request payload
+        data: Optional request payload, JSON-encoded unless already given as
+            serialized bytes
         entity_name: Name of resource for logging
 
     Returns:
@@ -34,37 +204,38 @@ def make_request(
     logger.debug(f"{method} {url}")
 
     try:
-        request_data = json.dumps(data).encode("utf-8") if data else None
-        req = urllib.request.Request(
-            url, data=request_data, headers=headers, method=method
-        )
-
-        with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as response:
-            response_data = response.read().decode("utf-8")
-            status_code = response.getcode()
-
-            if status_code in (200, 201):
-                logger.info(f"✓ Successfully processed {entity_name}")
-                logger.debug(f"Response: {response_data}")
-                return True, response_data, status_code
+        if isinstance(data, bytes):
+            request_data = data
+        else:
+            request_data = json.dumps(data).encode("utf-8") if data else None
+        status_code, reason, body = send_request(url, method, headers, request_data)
+
+        if status_code >= 400:
+            error_body = body.decode("utf-8") if body else "No error body"
+
+            if status_code == 409:
+                logger.info(f"✓ {entity_name} already exists")
+                return True, error_body, status_code
             else:
-                logger.warning(f"Unexpected status {status_code} for {entity_name}")
-                logger.debug(f"Response: {response_data}")
-                return False, response_data, status_code
+                logger.error(
+                    f"✗ HTTP {status_code} error for {entity_name}: {reason}"
+                )
+                logger.error(f"Error body: {error_body}")
+                return False, error_body, status_code
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else "No error body"
+        response_data = body.decode("utf-8")
 
-        if e.code == 409:
-            logger.info(f"✓ {entity_name} already exists")
-            return True, error_body, e.code
+        if status_code in (200, 201):
+            logger.info(f"✓ Successfully processed {entity_name}")
+            logger.debug(f"Response: {response_data}")
+            return True, response_data, status_code
         else:
-            logger.error(f"✗ HTTP {e.code} error for {entity_name}: {e.reason}")
-            logger.error(f"Error body: {error_body}")
-            return False, error_body, e.code
+            logger.warning(f"Unexpected status {status_code} for {entity_name}")
+            logger.debug(f"Response: {response_data}")
+            return False, response_data, status_code
 
-    except urllib.error.URLError as e:
-        logger.error(f"✗ URL error for {entity_name}: {e.reason}")
+    except OSError as e:
+        logger.error(f"✗ URL error for {entity_name}: {e}")
         return False, None, None
 
     except Exception as e:
@@ -76,7 +247,7 @@ def query_api(
     url: str,
     headers: Dict[str, str],
     entity_name: str,
-    query_body: Optional[Dict[str, Any]] = None,
+    query_body: Optional[Union[Dict[str, Any], bytes]] = None,
 ) -> Optional[Any]:
     """
     Query an API endpoint (GET or POST with query body).
@@ -85,7 +256,8 @@ def query_api(
         url: API endpoint URL
         headers: HTTP headers
         entity_name: Resource name for logging
-        query_body: Optional query payload (if provided, uses POST, otherwise GET)
+        query_body: Optional query payload, as a dict or already serialized
+            bytes (if provided, uses POST, otherwise GET)
 
     Returns:
         Parsed JSON response or None on failure
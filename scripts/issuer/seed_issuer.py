@@ -83,6 +83,10 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     try:
         if run_seeding_sequence():
             logger.info("=" * 70)
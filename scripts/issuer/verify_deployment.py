@@ -11,16 +11,18 @@ Verification Steps:
     5. Credentials - All credential definitions exist
 """
 
+import functools
 import json
 import logging
 import sys
+import threading
 import time
-import urllib.request
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
-from http_utils import query_api
+from http_utils import query_api, send_request
 
-from config import HTTP_TIMEOUT_SECONDS, Config, load_config
+from config import Config, load_config
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,12 @@ logger = logging.getLogger(__name__)
 HEALTH_CHECK_MAX_RETRIES = 30
 HEALTH_CHECK_RETRY_DELAY = 10
 
+# Query body for the admin API query endpoints, serialized once. Immutable
+# bytes can be shared between calls without being copied or re-encoded.
+DEFAULT_QUERY_BODY = json.dumps(
+    {"filterExpression": [], "limit": 100, "offset": 0}
+).encode("utf-8")
+
 
 def check_health_endpoint(config: Config) -> bool:
     """Check if the Issuer Service health endpoint is responding."""
@@ -35,14 +43,12 @@ def check_health_endpoint(config: Config) -> bool:
     logger.info(f"Checking health endpoint: {url}")
 
     try:
-        with urllib.request.urlopen(url, timeout=HTTP_TIMEOUT_SECONDS) as response:
-            if response.getcode() == 200:
-                logger.info("✓ Issuer Service is healthy")
-                return True
-            logger.warning(
-                f"Health check returned unexpected status: {response.getcode()}"
-            )
-            return False
+        status_code, _, _ = send_request(url)
+        if status_code == 200:
+            logger.info("✓ Issuer Service is healthy")
+            return True
+        logger.warning(f"Health check returned unexpected status: {status_code}")
+        return False
     except Exception as e:
         logger.error(f"✗ Health check failed: {e}")
         return False
@@ -71,14 +77,76 @@ def wait_for_health(config: Config) -> bool:
 
 
 def query_with_default_body(
-    config: Config, url: str, entity_name: str
+    url: str, headers: Dict[str, str], entity_name: str
 ) -> Optional[Any]:
     """Query an API endpoint using POST with default query body."""
-    query_body = {"filterExpression": [], "limit": 100, "offset": 0}
-    return query_api(url, config.get_headers(), entity_name, query_body)
+    return query_api(url, headers, entity_name, DEFAULT_QUERY_BODY)
+
+
+class _GroupedLogHandler(logging.Handler):
+    """Root handler holding back the records logged by checks in worker threads."""
+
+    def __init__(self, targets: List[logging.Handler]) -> None:
+        super().__init__()
+        self.targets = targets
+        # Records of the check currently running in each worker thread
+        self.buffers: Dict[int, List[logging.LogRecord]] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        buffer = self.buffers.get(record.thread)
+        if buffer is not None:
+            buffer.append(record)
+        else:
+            self.replay([record])
+
+    def replay(self, records: List[logging.LogRecord]) -> None:
+        """Pass records on to the original root handlers."""
+        for record in records:
+            for handler in self.targets:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+
+def run_with_grouped_logs(tasks: Sequence[Callable[[], bool]]) -> List[bool]:
+    """
+    Run checks concurrently, emitting each check's log records together and in order.
+
+    Each check logs its own section of the report, so its records are buffered
+    and passed to the root handlers once it and all checks before it finished.
+    """
+    if not tasks:
+        return []
+
+    root = logging.getLogger()
+    targets = root.handlers[:]
+    grouped_handler = _GroupedLogHandler(targets)
+    task_records: List[List[logging.LogRecord]] = [[] for _ in tasks]
+
+    def run_task(index: int) -> bool:
+        ident = threading.get_ident()
+        grouped_handler.buffers[ident] = task_records[index]
+        try:
+            return tasks[index]()
+        finally:
+            del grouped_handler.buffers[ident]
+
+    root.handlers = [grouped_handler]
+    try:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(run_task, i) for i in range(len(tasks))]
+            results = []
+            for future, records in zip(futures, task_records):
+                # Wait for the check before emitting what it logged
+                future.exception()
+                grouped_handler.replay(records)
+                results.append(future.result())
+    finally:
+        root.handlers = targets
 
+    return results
 
-def verify_participants(config: Config) -> bool:
+
+def verify_participants(config: Config, headers: Dict[str, str]) -> bool:
     """Verify that all participants are registered."""
     logger.info("=" * 60)
     logger.info("Verifying Participants")
@@ -86,7 +154,7 @@ def verify_participants(config: Config) -> bool:
 
     participants = query_api(
         config.get_query_participants_url(),
-        config.get_headers(),
+        headers,
         "participants",
     )
 
@@ -123,14 +191,14 @@ def verify_participants(config: Config) -> bool:
     return True
 
 
-def verify_attestations(config: Config) -> bool:
+def verify_attestations(config: Config, headers: Dict[str, str]) -> bool:
     """Verify that all attestation definitions exist."""
     logger.info("=" * 60)
     logger.info("Verifying Attestation Definitions")
     logger.info("=" * 60)
 
     attestations = query_with_default_body(
-        config, config.get_query_attestations_url(), "attestations"
+        config.get_query_attestations_url(), headers, "attestations"
     )
 
     if attestations is None:
@@ -152,14 +220,14 @@ def verify_attestations(config: Config) -> bool:
     return True
 
 
-def verify_credentials(config: Config) -> bool:
+def verify_credentials(config: Config, headers: Dict[str, str]) -> bool:
     """Verify that all credential definitions exist."""
     logger.info("=" * 60)
     logger.info("Verifying Credential Definitions")
     logger.info("=" * 60)
 
     credentials = query_with_default_body(
-        config, config.get_query_credentials_url(), "credential definitions"
+        config.get_query_credentials_url(), headers, "credential definitions"
     )
 
     if credentials is None:
@@ -199,17 +267,28 @@ def verify_all(config: Config, wait_for_service: bool = True) -> bool:
         logger.error("✗ Service health check failed")
         return False
 
+    headers = config.get_headers()
     checks = [
         verify_participants,
         verify_attestations,
         verify_credentials,
     ]
 
-    return all(check(config) for check in checks)
+    # The checks query independent endpoints, so run them concurrently; each
+    # check's section of the report is still logged together and in order
+    results = run_with_grouped_logs(
+        [functools.partial(check, config, headers) for check in checks]
+    )
+
+    return all(results)
 
 
 def main() -> int:
     """Main entry point for verification script."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     logger.info("=" * 60)
     logger.info("Issuer Service - Deployment Verification")
     logger.info("=" * 60)
@@ -5,6 +5,7 @@ Common Utility Functions for Provider Scripts
 This module provides shared functionality used across multiple provider scripts:
 - Component health checking and waiting
 - Logging configuration
+- Running tasks concurrently with their log output kept together
 - DID validation
 - Common patterns
 
@@ -13,13 +14,17 @@ Usage:
 """
 
 import logging
+import threading
 import time
 import urllib.error
 import urllib.request
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def setup_logging(
     level: int = logging.INFO, format_string: Optional[str] = None
@@ -170,3 +175,73 @@ def check_component_health(
     except Exception as e:
         logger.debug(f"❌ Cannot reach {component_name}: {e}")
         return False
+
+
+class _GroupedLogHandler(logging.Handler):
+    """Root handler holding back the records logged by tasks in worker threads."""
+
+    def __init__(self, targets: List[logging.Handler]) -> None:
+        super().__init__()
+        self.targets = targets
+        # Records of the task currently running in each worker thread
+        self.buffers: Dict[int, List[logging.LogRecord]] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        buffer = self.buffers.get(record.thread)
+        if buffer is not None:
+            buffer.append(record)
+        else:
+            self.replay([record])
+
+    def replay(self, records: List[logging.LogRecord]) -> None:
+        """Pass records on to the original root handlers."""
+        for record in records:
+            for handler in self.targets:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+
+def run_with_grouped_logs(tasks: Sequence[Callable[[], T]]) -> List[T]:
+    """
+    Run tasks concurrently, emitting each task's log records together and in order.
+
+    Records logged while a task runs are buffered and passed to the root
+    handlers once the task has finished and all tasks before it have been
+    emitted, so the output reads as if the tasks had run one after another.
+
+    Args:
+        tasks: Callables without arguments
+
+    Returns:
+        Results of the tasks, in the same order
+    """
+    if not tasks:
+        return []
+
+    root = logging.getLogger()
+    targets = root.handlers[:]
+    grouped_handler = _GroupedLogHandler(targets)
+    task_records: List[List[logging.LogRecord]] = [[] for _ in tasks]
+
+    def run_task(index: int) -> T:
+        ident = threading.get_ident()
+        grouped_handler.buffers[ident] = task_records[index]
+        try:
+            return tasks[index]()
+        finally:
+            del grouped_handler.buffers[ident]
+
+    root.handlers = [grouped_handler]
+    try:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(run_task, i) for i in range(len(tasks))]
+            results = []
+            for future, records in zip(futures, task_records):
+                # Wait for the task before emitting what it logged
+                future.exception()
+                grouped_handler.replay(records)
+                results.append(future.result())
+    finally:
+        root.handlers = targets
+
+    return results
@@ -23,13 +23,6 @@ import sys
 import urllib.parse
 from typing import Dict, List, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -165,7 +158,8 @@ MASK_LENGTH = 20
 
 HTTP_TIMEOUT_SECONDS = 30
 HTTP_RETRY_COUNT = 3
-HTTP_RETRY_DELAY_SECONDS = 5
+HTTP_RETRY_DELAY_SECONDS = 0.5
+HTTP_RETRY_MAX_DELAY_SECONDS = 4
 
 
 class Config:
@@ -701,6 +695,12 @@ def load_config() -> Optional[Config]:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
     # Test configuration loading
     config = load_config()
     if config:
@@ -21,7 +21,7 @@ Test Flow:
 
 Usage:
     python3 scripts/provider/e2e_test.py [--skip-prerequisites] [--asset-id ASSET_ID] \
-        [--target-address ADDRESS] [--target-did DID]
+        [--target-address ADDRESS] [--target-did DID] [--sequential] [--fail-fast]
 
     Or using Task automation:
         task e2e:test
@@ -33,6 +33,8 @@ Options:
     --asset-id ASSET_ID   Target specific asset ID (default: asset-1)
     --target-address      Target DSP address (default: provider's own address)
     --target-did          Target DID (default: provider's own DID)
+    --sequential          Run prerequisite checks sequentially (for debugging)
+    --fail-fast           Stop prerequisite checks if services are unreachable
     --verbose             Enable verbose output
 
 Environment Variables:
@@ -42,18 +44,27 @@ Environment Variables:
         PROVIDER_CP_PROTOCOL_PORT: DSP protocol port (default: 8082)
         PROVIDER_DP_PUBLIC_PORT: Data plane public API port (default: 11002)
         PROVIDER_MANAGEMENT_API_KEY: Management API key (default: password)
+    EDC_TEST_CACHE: Set to 1 to reuse recent service health results across runs
+    EDC_FAIL_FAST: Set to 1 to enable --fail-fast by default
 """
 
 import argparse
+import functools
+import getpass
 import json
 import logging
+import os
+import re
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Tuple
 
-from http_utils import make_http_request
+from common_utils import run_with_grouped_logs
+from http_utils import make_http_request, make_json_request, to_json
 
-from config import load_config
+from config import HTTP_RETRY_COUNT, load_config
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -75,6 +86,16 @@ DSP_PROTOCOL = "dataspace-protocol-http"
 # JSON-LD context
 EDC_CONTEXT = {"edc": "https://w3id.org/edc/v0.0.1/ns/"}
 
+# QuerySpec body used to list assets, policies and contract definitions
+QUERY_SPEC_BODY = to_json({"@context": EDC_CONTEXT, "@type": "QuerySpec", "limit": 50})
+
+# Service health probe cache (opt-in via EDC_TEST_CACHE=1). Successful probes
+# are reused for longer than failed ones so a recovering service is re-probed
+# quickly. The temp directory is shared, so the cache is kept per user.
+ENV_TEST_CACHE = "EDC_TEST_CACHE"
+PROBE_CACHE_TTL_OK_SECONDS = 27
+PROBE_CACHE_TTL_FAIL_SECONDS = 9
+
 # Expected asset ID for testing (from seed_participant.py)
 DEFAULT_TARGET_ASSET_ID = "asset-1"
 
@@ -85,18 +106,131 @@ STATE_TERMINATED = "TERMINATED"
 # Transfer process states
 STATE_STARTED = "STARTED"
 
+# Dataplane state, matched directly in the raw /dataplanes response
+STATE_AVAILABLE = "AVAILABLE"
+DATAPLANE_AVAILABLE_RE = re.compile(r'"state"\s*:\s*"AVAILABLE"')
+
 
 # ============================================================
 # PREREQUISITE CHECKS
 # ============================================================
 
 
-def check_service_health(config) -> bool:
+def get_probe_cache_path() -> str:
+    """
+    Get the path of the current user's probe cache file.
+
+    Returns:
+        Cache file path in the temp directory, named after the user
+    """
+    # os.getuid() is POSIX-only; fall back to the login name elsewhere
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    return os.path.join(tempfile.gettempdir(), f"edc_probe_cache_{user}.json")
+
+
+def load_probe_cache() -> Dict:
+    """
+    Load cached health probe results from disk.
+
+    Returns:
+        Mapping of URL to cached result (empty if missing or unreadable)
+    """
+    try:
+        with open(get_probe_cache_path(), encoding="utf-8") as f:
+            # Ignore a file planted under our cache name by another user
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                return {}
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_probe_cache(cache: Dict) -> None:
+    """
+    Write health probe results to disk, ignoring write failures.
+
+    Args:
+        cache: Mapping of URL to cached result
+    """
+    cache_path = get_probe_cache_path()
+    tmp_path = None
+    try:
+        # mkstemp creates a new file exclusively, so an existing file or
+        # symlink in the shared temp directory is never written through
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path),
+            prefix=os.path.basename(cache_path) + ".",
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write probe cache %s: %s", cache_path, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def cached_health_probe(
+    url: str, cache: Dict, retries: Optional[int] = None
+) -> Tuple[bool, int, str]:
+    """
+    Probe a health endpoint, reusing a recent result from the cache.
+
+    Args:
+        url: Health endpoint URL
+        cache: Mapping of URL to cached result, updated in place
+        retries: Number of retries on transient failures (default: HTTP_RETRY_COUNT)
+
+    Returns:
+        Tuple of (success, status_code, response_body)
+    """
+    now = time.time()
+    entry = cache.get(url)
+    if isinstance(entry, dict):
+        ts = entry.get("ts")
+        success = entry.get("success")
+        status_code = entry.get("status")
+        response = entry.get("body")
+        # A malformed entry (hand-edited or from another version) is a miss
+        if (
+            isinstance(ts, (int, float))
+            and isinstance(success, bool)
+            and isinstance(status_code, int)
+            and isinstance(response, str)
+        ):
+            ttl = (
+                PROBE_CACHE_TTL_OK_SECONDS
+                if success
+                else PROBE_CACHE_TTL_FAIL_SECONDS
+            )
+            if now - ts < ttl:
+                logger.debug("Using cached health result for %s", url)
+                return success, status_code, response
+
+    success, status_code, response = make_http_request(url, "GET", retries=retries)
+    cache[url] = {
+        "success": success,
+        "status": status_code,
+        "body": response,
+        "ts": now,
+    }
+    return success, status_code, response
+
+
+def check_service_health(config, retries: Optional[int] = None) -> bool:
     """
     Check that all required services are healthy.
 
+    With EDC_TEST_CACHE=1, results of recent probes (from this or a previous
+    run) are reused instead of hitting the health endpoints again.
+
     Args:
         config: Configuration object
+        retries: Number of retries per probe (default: HTTP_RETRY_COUNT)
 
     Returns:
         True if all services are healthy, False otherwise
@@ -112,13 +246,25 @@ def check_service_health(config) -> bool:
 
     all_healthy = True
 
-    for service_name, health_url in health_urls.items():
-        success, status_code, response = make_http_request(health_url, "GET")
+    use_cache = os.environ.get(ENV_TEST_CACHE) == "1"
+    if use_cache:
+        cache = load_probe_cache()
+        probe = functools.partial(cached_health_probe, cache=cache, retries=retries)
+    else:
+        probe = functools.partial(make_http_request, method="GET", retries=retries)
+
+    # Probes are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=len(health_urls)) as executor:
+        results = list(executor.map(probe, health_urls.values()))
 
+    if use_cache:
+        save_probe_cache(cache)
+
+    for service_name, (success, status_code, response) in zip(health_urls, results):
         if success and status_code == 200:
-            logger.info(f"✅ {service_name} is healthy")
+            logger.info("✅ %s is healthy", service_name)
         else:
-            logger.error(f"❌ {service_name} is not healthy: {status_code}")
+            logger.error("❌ %s is not healthy: %s", service_name, status_code)
             all_healthy = False
 
     if not all_healthy:
@@ -148,26 +294,22 @@ def check_assets_exist(config) -> bool:
     url = f"http://{config.provider_public_host}:{config.provider_cp_management_port}/api/management/v3/assets/request"
     headers = config.get_management_headers()
 
-    query_body = json.dumps(
-        {"@context": EDC_CONTEXT, "@type": "QuerySpec", "limit": 50}
+    success, status_code, assets = make_json_request(
+        url, "POST", headers, QUERY_SPEC_BODY, retries=HTTP_RETRY_COUNT
     )
 
-    success, status_code, response = make_http_request(url, "POST", headers, query_body)
-
     if success and status_code == 200:
-        try:
-            assets = json.loads(response)
-            if isinstance(assets, list) and len(assets) > 0:
-                logger.info(f"✅ Found {len(assets)} assets")
-                return True
-            else:
-                logger.error("❌ No assets found")
-                return False
-        except json.JSONDecodeError:
-            logger.error("❌ Failed to parse assets response")
+        if isinstance(assets, list) and len(assets) > 0:
+            logger.info("✅ Found %s assets", len(assets))
+            return True
+        else:
+            logger.error("❌ No assets found")
             return False
+    elif status_code == 200:
+        logger.error("❌ Failed to parse assets response")
+        return False
     else:
-        logger.error(f"❌ Failed to query assets: {status_code}")
+        logger.error("❌ Failed to query assets: %s", status_code)
         return False
 
 
@@ -187,26 +329,22 @@ def check_policies_exist(config) -> bool:
     url = f"http://{config.provider_public_host}:{config.provider_cp_management_port}/api/management/v3/policydefinitions/request"
     headers = config.get_management_headers()
 
-    query_body = json.dumps(
-        {"@context": EDC_CONTEXT, "@type": "QuerySpec", "limit": 50}
+    success, status_code, policies = make_json_request(
+        url, "POST", headers, QUERY_SPEC_BODY, retries=HTTP_RETRY_COUNT
     )
 
-    success, status_code, response = make_http_request(url, "POST", headers, query_body)
-
     if success and status_code == 200:
-        try:
-            policies = json.loads(response)
-            if isinstance(policies, list) and len(policies) > 0:
-                logger.info(f"✅ Found {len(policies)} policy definitions")
-                return True
-            else:
-                logger.error("❌ No policies found")
-                return False
-        except json.JSONDecodeError:
-            logger.error("❌ Failed to parse policies response")
+        if isinstance(policies, list) and len(policies) > 0:
+            logger.info("✅ Found %s policy definitions", len(policies))
+            return True
+        else:
+            logger.error("❌ No policies found")
             return False
+    elif status_code == 200:
+        logger.error("❌ Failed to parse policies response")
+        return False
     else:
-        logger.error(f"❌ Failed to query policies: {status_code}")
+        logger.error("❌ Failed to query policies: %s", status_code)
         return False
 
 
@@ -226,26 +364,22 @@ def check_contract_definitions_exist(config) -> bool:
     url = f"http://{config.provider_public_host}:{config.provider_cp_management_port}/api/management/v3/contractdefinitions/request"
     headers = config.get_management_headers()
 
-    query_body = json.dumps(
-        {"@context": EDC_CONTEXT, "@type": "QuerySpec", "limit": 50}
+    success, status_code, contracts = make_json_request(
+        url, "POST", headers, QUERY_SPEC_BODY, retries=HTTP_RETRY_COUNT
     )
 
-    success, status_code, response = make_http_request(url, "POST", headers, query_body)
-
     if success and status_code == 200:
-        try:
-            contracts = json.loads(response)
-            if isinstance(contracts, list) and len(contracts) > 0:
-                logger.info(f"✅ Found {len(contracts)} contract definitions")
-                return True
-            else:
-                logger.error("❌ No contract definitions found")
-                return False
-        except json.JSONDecodeError:
-            logger.error("❌ Failed to parse contract definitions response")
+        if isinstance(contracts, list) and len(contracts) > 0:
+            logger.info("✅ Found %s contract definitions", len(contracts))
+            return True
+        else:
+            logger.error("❌ No contract definitions found")
             return False
+    elif status_code == 200:
+        logger.error("❌ Failed to parse contract definitions response")
+        return False
     else:
-        logger.error(f"❌ Failed to query contract definitions: {status_code}")
+        logger.error("❌ Failed to query contract definitions: %s", status_code)
         return False
 
 
@@ -267,16 +401,20 @@ def check_dataplane_available(config) -> bool:
     success, status_code, response = make_http_request(url, "GET", headers)
 
     if success and status_code == 200:
+        # Fast path: an available dataplane can be spotted without parsing
+        # the whole response; only parse it to explain a failure
+        if DATAPLANE_AVAILABLE_RE.search(response):
+            logger.info("✅ Dataplane is available")
+            return True
+
         try:
             data = json.loads(response)
             if isinstance(data, list) and len(data) > 0:
                 state = data[0].get("state", "UNKNOWN")
-                if state == "AVAILABLE":
-                    logger.info("✅ Dataplane is available")
-                    return True
-                else:
-                    logger.error(f"❌ Dataplane state is {state}, expected AVAILABLE")
-                    return False
+                logger.error(
+                    "❌ Dataplane state is %s, expected %s", state, STATE_AVAILABLE
+                )
+                return False
             else:
                 logger.error("❌ No dataplane registered")
                 return False
@@ -284,16 +422,49 @@ def check_dataplane_available(config) -> bool:
             logger.error("❌ Invalid response from dataplane endpoint")
             return False
     else:
-        logger.error(f"❌ Failed to query dataplane status: {status_code}")
+        logger.error("❌ Failed to query dataplane status: %s", status_code)
         return False
 
 
-def check_prerequisites(config) -> bool:
+def run_prerequisite_check(config, check_name: str, check_func) -> bool:
+    """
+    Run a single prerequisite check, logging failures and exceptions.
+
+    Args:
+        config: Configuration object
+        check_name: Human-readable check name
+        check_func: Check function taking the configuration
+
+    Returns:
+        True if the check passed, False otherwise
+    """
+    try:
+        if check_func(config):
+            return True
+        logger.error("❌ %s check failed", check_name)
+    except Exception as e:
+        logger.error("❌ %s check failed with exception: %s", check_name, e)
+    return False
+
+
+def check_prerequisites(
+    config, sequential: bool = False, fail_fast: bool = False
+) -> bool:
     """
     Check all prerequisites for E2E testing.
 
+    The checks query different endpoints and do not depend on each other, so
+    they run concurrently unless sequential is set (useful for debugging).
+    Either way, the log output of each check is emitted together and in order.
+
+    With fail_fast, service health is checked first without retries, and the
+    remaining checks are skipped if any service is unreachable, since they
+    would all fail (each after its own retries) against a stack that is down.
+
     Args:
         config: Configuration object
+        sequential: Run checks one after another instead of concurrently
+        fail_fast: Stop early if services are unreachable
 
     Returns:
         True if all prerequisites are met, False otherwise
@@ -310,17 +481,32 @@ def check_prerequisites(config) -> bool:
         ("Dataplane Available", check_dataplane_available),
     ]
 
-    all_passed = True
+    results = []
 
-    for check_name, check_func in checks:
-        logger.info(f"\n--- {check_name} ---")
-        try:
-            if not check_func(config):
-                logger.error(f"❌ {check_name} check failed")
-                all_passed = False
-        except Exception as e:
-            logger.error(f"❌ {check_name} check failed with exception: {e}")
-            all_passed = False
+    if fail_fast:
+        check_name, _ = checks.pop(0)
+        logger.info("\n--- %s ---", check_name)
+        health_check = functools.partial(check_service_health, retries=0)
+        results.append(run_prerequisite_check(config, check_name, health_check))
+        if not results[0]:
+            logger.error("❌ Services unreachable, skipping remaining checks")
+            checks = []
+
+    def run_check(check_name: str, check_func) -> bool:
+        logger.info("\n--- %s ---", check_name)
+        return run_prerequisite_check(config, check_name, check_func)
+
+    if sequential:
+        for check_name, check_func in checks:
+            results.append(run_check(check_name, check_func))
+    else:
+        results.extend(
+            run_with_grouped_logs(
+                [functools.partial(run_check, *check) for check in checks]
+            )
+        )
+
+    all_passed = all(results)
 
     if all_passed:
         logger.info("\n✅ All prerequisite checks passed\n")
@@ -355,14 +541,14 @@ def request_catalog(config, target_address: str, target_did: str) -> Optional[Di
     Returns:
         Catalog response or None on failure
     """
-    logger.info(f"Requesting catalog from {target_did} ({target_address})...")
+    logger.info("Requesting catalog from %s (%s)...", target_did, target_address)
 
     # Use public host from config
     url = f"http://{config.provider_public_host}:{config.provider_cp_management_port}/api/management/v3/catalog/request"
     headers = config.get_management_headers()
 
     # Catalog request format from E2E_TEST_GUIDE.md
-    catalog_request = json.dumps(
+    catalog_request = to_json(
         {
             "@context": EDC_CONTEXT,
             "@type": "CatalogRequest",
@@ -373,23 +559,22 @@ def request_catalog(config, target_address: str, target_did: str) -> Optional[Di
         }
     )
 
-    success, status_code, response = make_http_request(
-        url, "POST", headers, catalog_request
+    success, status_code, catalog = make_json_request(
+        url, "POST", headers, catalog_request, retries=HTTP_RETRY_COUNT
     )
 
     if success and status_code == 200:
-        try:
-            catalog = json.loads(response)
-            logger.info("✅ Catalog retrieved successfully")
-            logger.debug(f"Catalog: {json.dumps(catalog, indent=2)}")
-            return catalog
-        except json.JSONDecodeError:
-            logger.error("❌ Failed to parse catalog response")
-            return None
+        logger.info("✅ Catalog retrieved successfully")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Catalog: %s", json.dumps(catalog, indent=2))
+        return catalog
+    elif status_code == 200:
+        logger.error("❌ Failed to parse catalog response")
+        return None
     else:
-        logger.error(f"❌ Failed to retrieve catalog: {status_code}")
-        if response:
-            logger.debug(f"Response: {response}")
+        logger.error("❌ Failed to retrieve catalog: %s", status_code)
+        if catalog:
+            logger.debug("Response: %s", catalog)
         return None
 
 
@@ -408,7 +593,7 @@ def extract_offer_from_catalog(
     Returns:
         Tuple of (asset_id, policy_dict) or None if not found
     """
-    logger.info(f"Searching for asset '{target_asset_id}' in catalog...")
+    logger.info("Searching for asset '%s' in catalog...", target_asset_id)
 
     datasets = catalog.get("dcat:dataset", [])
     if not datasets:
@@ -422,11 +607,11 @@ def extract_offer_from_catalog(
         logger.error("❌ Invalid dataset format in catalog")
         return None
 
-    logger.info(f"Catalog contains {len(datasets)} datasets")
+    logger.info("Catalog contains %s datasets", len(datasets))
 
     for dataset in datasets:
         asset_id = dataset.get("@id")
-        logger.debug(f"Checking dataset: {asset_id}")
+        logger.debug("Checking dataset: %s", asset_id)
 
         if asset_id == target_asset_id:
             # Extract full policy from odrl:hasPolicy (E2E_TEST_GUIDE.md format)
@@ -434,16 +619,17 @@ def extract_offer_from_catalog(
             policy_id = policy.get("@id")
 
             if not policy_id:
-                logger.error(f"❌ Asset {asset_id} has no policy")
+                logger.error("❌ Asset %s has no policy", asset_id)
                 return None
 
-            logger.info(f"✅ Found asset: {asset_id}")
-            logger.info(f"✅ Policy ID: {policy_id}")
+            logger.info("✅ Found asset: %s", asset_id)
+            logger.info("✅ Policy ID: %s", policy_id)
             return asset_id, policy
 
     logger.error(
-        f"❌ Asset '{target_asset_id}' not found in catalog\n"
-        f"Available assets: {[ds.get('@id') for ds in datasets]}"
+        "❌ Asset '%s' not found in catalog\nAvailable assets: %s",
+        target_asset_id,
+        [ds.get("@id") for ds in datasets],
     )
     return None
 
@@ -513,7 +699,7 @@ def initiate_contract_negotiation(
     negotiation_policy["odrl:assigner"] = {"@id": target_did}
     negotiation_policy["odrl:target"] = {"@id": asset_id}
     
-    negotiation_request = json.dumps(
+    negotiation_request = to_json(
         {
             "@context": {
                 "edc": "https://w3id.org/edc/v0.0.1/ns/",
@@ -527,23 +713,21 @@ def initiate_contract_negotiation(
         }
     )
 
-    success, status_code, response = make_http_request(
+    success, status_code, result = make_json_request(
         url, "POST", headers, negotiation_request
     )
 
     if success and status_code == 200:
-        try:
-            result = json.loads(response)
-            negotiation_id = result.get("@id")
-            logger.info(f"✅ Negotiation initiated: {negotiation_id}")
-            return negotiation_id
-        except json.JSONDecodeError:
-            logger.error("❌ Failed to parse negotiation response")
-            return None
+        negotiation_id = result.get("@id")
+        logger.info("✅ Negotiation initiated: %s", negotiation_id)
+        return negotiation_id
+    elif status_code == 200:
+        logger.error("❌ Failed to parse negotiation response")
+        return None
     else:
-        logger.error(f"❌ Failed to initiate negotiation: {status_code}")
-        if response:
-            logger.debug(f"Response: {response}")
+        logger.error("❌ Failed to initiate negotiation: %s", status_code)
+        if result:
+            logger.debug("Response: %s", result)
         return None
 
 
@@ -566,43 +750,41 @@ def poll_negotiation_status(config, negotiation_id: str) -> Optional[str]:
     headers = config.get_management_headers()
 
     for attempt in range(1, POLL_MAX_ATTEMPTS + 1):
-        logger.debug(f"Poll attempt {attempt}/{POLL_MAX_ATTEMPTS}")
+        logger.debug("Poll attempt %s/%s", attempt, POLL_MAX_ATTEMPTS)
 
-        success, status_code, response = make_http_request(url, "GET", headers)
+        success, status_code, negotiation = make_json_request(url, "GET", headers)
 
         if success and status_code == 200:
-            try:
-                negotiation = json.loads(response)
-                state = negotiation.get("state")
-                logger.info(f"Negotiation state: {state}")
-
-                if state == STATE_FINALIZED:
-                    agreement_id = negotiation.get("contractAgreementId")
-                    logger.info(f"✅ Negotiation finalized: {agreement_id}")
-                    return agreement_id
-                elif state == STATE_TERMINATED:
-                    logger.error(
-                        "❌ Negotiation terminated\n"
-                        "Possible causes (from E2E_TEST_GUIDE.md):\n"
-                        "  - Policy evaluation failed\n"
-                        "  - Missing or invalid credentials\n"
-                        "  - DID resolution failed\n"
-                        "Check logs: docker logs mvd-provider-controlplane"
-                    )
-                    return None
-                else:
-                    # Still in progress (REQUESTING, REQUESTED, AGREEING, etc.)
-                    time.sleep(POLL_INTERVAL_SECONDS)
-
-            except json.JSONDecodeError:
-                logger.error("❌ Failed to parse negotiation status")
+            state = negotiation.get("state")
+            logger.info("Negotiation state: %s", state)
+
+            if state == STATE_FINALIZED:
+                agreement_id = negotiation.get("contractAgreementId")
+                logger.info("✅ Negotiation finalized: %s", agreement_id)
+                return agreement_id
+            elif state == STATE_TERMINATED:
+                logger.error(
+                    "❌ Negotiation terminated\n"
+                    "Possible causes (from E2E_TEST_GUIDE.md):\n"
+                    "  - Policy evaluation failed\n"
+                    "  - Missing or invalid credentials\n"
+                    "  - DID resolution failed\n"
+                    "Check logs: docker logs mvd-provider-controlplane"
+                )
                 return None
+            else:
+                # Still in progress (REQUESTING, REQUESTED, AGREEING, etc.)
+                time.sleep(POLL_INTERVAL_SECONDS)
+        elif status_code == 200:
+            logger.error("❌ Failed to parse negotiation status")
+            return None
         else:
-            logger.error(f"❌ Failed to query negotiation: {status_code}")
+            logger.error("❌ Failed to query negotiation: %s", status_code)
             return None
 
     logger.error(
-        f"❌ Negotiation polling timed out after {POLL_MAX_ATTEMPTS * POLL_INTERVAL_SECONDS} seconds"
+        "❌ Negotiation polling timed out after %s seconds",
+        POLL_MAX_ATTEMPTS * POLL_INTERVAL_SECONDS,
     )
     return None
 
@@ -670,7 +852,7 @@ def initiate_transfer_process(
     headers = config.get_management_headers()
 
     # Transfer request format from E2E_TEST_GUIDE.md (HttpProxy type)
-    transfer_request = json.dumps(
+    transfer_request = to_json(
         {
             "@context": EDC_CONTEXT,
             "@type": "TransferRequest",
@@ -684,23 +866,21 @@ def initiate_transfer_process(
         }
     )
 
-    success, status_code, response = make_http_request(
+    success, status_code, result = make_json_request(
         url, "POST", headers, transfer_request
     )
 
     if success and status_code == 200:
-        try:
-            result = json.loads(response)
-            transfer_id = result.get("@id")
-            logger.info(f"✅ Transfer initiated: {transfer_id}")
-            return transfer_id
-        except json.JSONDecodeError:
-            logger.error("❌ Failed to parse transfer response")
-            return None
+        transfer_id = result.get("@id")
+        logger.info("✅ Transfer initiated: %s", transfer_id)
+        return transfer_id
+    elif status_code == 200:
+        logger.error("❌ Failed to parse transfer response")
+        return None
     else:
-        logger.error(f"❌ Failed to initiate transfer: {status_code}")
-        if response:
-            logger.debug(f"Response: {response}")
+        logger.error("❌ Failed to initiate transfer: %s", status_code)
+        if result:
+            logger.debug("Response: %s", result)
         return None
 
 
@@ -723,42 +903,40 @@ def poll_transfer_status(config, transfer_id: str) -> bool:
     headers = config.get_management_headers()
 
     for attempt in range(1, POLL_MAX_ATTEMPTS + 1):
-        logger.debug(f"Poll attempt {attempt}/{POLL_MAX_ATTEMPTS}")
+        logger.debug("Poll attempt %s/%s", attempt, POLL_MAX_ATTEMPTS)
 
-        success, status_code, response = make_http_request(url, "GET", headers)
+        success, status_code, transfer = make_json_request(url, "GET", headers)
 
         if success and status_code == 200:
-            try:
-                transfer = json.loads(response)
-                state = transfer.get("state")
-                logger.info(f"Transfer state: {state}")
-
-                if state == STATE_STARTED:
-                    logger.info("✅ Transfer started successfully")
-                    return True
-                elif state == STATE_TERMINATED:
-                    logger.error(
-                        "❌ Transfer terminated\n"
-                        "Possible causes (from E2E_TEST_GUIDE.md):\n"
-                        "  - Invalid agreement ID\n"
-                        "  - Dataplane not reachable\n"
-                        "  - Backend API not configured\n"
-                        "Check logs: docker logs mvd-provider-dataplane"
-                    )
-                    return False
-                else:
-                    # Still in progress (REQUESTING, REQUESTED, STARTING, etc.)
-                    time.sleep(POLL_INTERVAL_SECONDS)
-
-            except json.JSONDecodeError:
-                logger.error("❌ Failed to parse transfer status")
+            state = transfer.get("state")
+            logger.info("Transfer state: %s", state)
+
+            if state == STATE_STARTED:
+                logger.info("✅ Transfer started successfully")
+                return True
+            elif state == STATE_TERMINATED:
+                logger.error(
+                    "❌ Transfer terminated\n"
+                    "Possible causes (from E2E_TEST_GUIDE.md):\n"
+                    "  - Invalid agreement ID\n"
+                    "  - Dataplane not reachable\n"
+                    "  - Backend API not configured\n"
+                    "Check logs: docker logs mvd-provider-dataplane"
+                )
                 return False
+            else:
+                # Still in progress (REQUESTING, REQUESTED, STARTING, etc.)
+                time.sleep(POLL_INTERVAL_SECONDS)
+        elif status_code == 200:
+            logger.error("❌ Failed to parse transfer status")
+            return False
         else:
-            logger.error(f"❌ Failed to query transfer: {status_code}")
+            logger.error("❌ Failed to query transfer: %s", status_code)
             return False
 
     logger.error(
-        f"❌ Transfer polling timed out after {POLL_MAX_ATTEMPTS * POLL_INTERVAL_SECONDS} seconds"
+        "❌ Transfer polling timed out after %s seconds",
+        POLL_MAX_ATTEMPTS * POLL_INTERVAL_SECONDS,
     )
     return False
 
@@ -820,19 +998,18 @@ def retrieve_edr(config, transfer_id: str) -> Optional[Dict]:
     url = f"http://{config.provider_public_host}:{config.provider_cp_management_port}/api/management/v3/edrs/{transfer_id}/dataaddress"
     headers = config.get_management_headers()
 
-    success, status_code, response = make_http_request(url, "GET", headers)
+    success, status_code, edr = make_json_request(url, "GET", headers)
 
     if success and status_code == 200:
-        try:
-            edr = json.loads(response)
-            logger.info("✅ EDR retrieved successfully")
-            logger.debug(f"EDR: {json.dumps(edr, indent=2)}")
-            return edr
-        except json.JSONDecodeError:
-            logger.error("❌ Failed to parse EDR response")
-            return None
+        logger.info("✅ EDR retrieved successfully")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("EDR: %s", json.dumps(edr, indent=2))
+        return edr
+    elif status_code == 200:
+        logger.error("❌ Failed to parse EDR response")
+        return None
     else:
-        logger.error(f"❌ Failed to retrieve EDR: {status_code}")
+        logger.error("❌ Failed to retrieve EDR: %s", status_code)
         return None
 
 
@@ -857,9 +1034,9 @@ def extract_edr_details(edr: Dict) -> Optional[Tuple[str, str]]:
         logger.error("❌ EDR missing required fields (endpoint or authCode)")
         return None
 
-    logger.info(f"✅ Endpoint: {endpoint}")
-    logger.info(f"✅ Auth Key: {auth_key}")
-    logger.debug(f"Auth Code: {auth_code[:20]}...")
+    logger.info("✅ Endpoint: %s", endpoint)
+    logger.info("✅ Auth Key: %s", auth_key)
+    logger.debug("Auth Code: %s...", auth_code[:20])
 
     return endpoint, auth_code
 
@@ -890,17 +1067,17 @@ def access_data_via_edr(endpoint: str, auth_code: str) -> Optional[str]:
             data = json.loads(response)
             # Show preview (first 2 items if list, or full object if small)
             preview = data[:2] if isinstance(data, list) else data
-            logger.info(f"Response preview:\n{json.dumps(preview, indent=2)}")
+            logger.info("Response preview:\n%s", json.dumps(preview, indent=2))
             if isinstance(data, list) and len(data) > 2:
-                logger.info(f"... and {len(data) - 2} more items")
+                logger.info("... and %s more items", len(data) - 2)
             return response
         except json.JSONDecodeError:
             # Not JSON, return as-is
-            logger.info(f"Response preview: {response[:200]}...")
+            logger.info("Response preview: %s...", response[:200])
             return response
     else:
         # Error handling from E2E_TEST_GUIDE.md troubleshooting section
-        logger.error(f"❌ Failed to access data: {status_code}")
+        logger.error("❌ Failed to access data: %s", status_code)
         if status_code == 401:
             logger.error("Cause: Token invalid or expired")
         elif status_code == 403:
@@ -910,7 +1087,7 @@ def access_data_via_edr(endpoint: str, auth_code: str) -> Optional[str]:
         elif status_code in [502, 504]:
             logger.error("Cause: Backend API unreachable")
         if response:
-            logger.debug(f"Response: {response[:500]}")
+            logger.debug("Response: %s", response[:500])
         return None
 
 
@@ -958,6 +1135,8 @@ def run_e2e_test(
     target_address: str = None,
     target_did: str = None,
     skip_prerequisites: bool = False,
+    sequential: bool = False,
+    fail_fast: bool = False,
 ) -> bool:
     """
     Run complete end-to-end test.
@@ -968,6 +1147,8 @@ def run_e2e_test(
         target_address: Target DSP address (optional)
         target_did: Target DID (optional)
         skip_prerequisites: Skip prerequisite checks (not recommended)
+        sequential: Run prerequisite checks one after another
+        fail_fast: Stop prerequisite checks early if services are unreachable
 
     Returns:
         True if all phases successful, False otherwise
@@ -981,15 +1162,17 @@ def run_e2e_test(
     logger.info("=" * 60)
     logger.info("MINIMUM VIABLE DATASPACE - END-TO-END TEST")
     logger.info("=" * 60)
-    logger.info(f"Target Asset:   {target_asset_id}")
-    logger.info(f"Target Address: {target_address}")
-    logger.info(f"Target DID:     {target_did}")
-    logger.info(f"Provider DID:   {config.provider_did}")
+    logger.info("Target Asset:   %s", target_asset_id)
+    logger.info("Target Address: %s", target_address)
+    logger.info("Target DID:     %s", target_did)
+    logger.info("Provider DID:   %s", config.provider_did)
     logger.info("=" * 60)
 
     # Phase 0: Prerequisites (optional skip)
     if not skip_prerequisites:
-        if not check_prerequisites(config):
+        if not check_prerequisites(
+            config, sequential=sequential, fail_fast=fail_fast
+        ):
             logger.error("\n❌ E2E Test Failed - Prerequisites not met\n")
             return False
     else:
@@ -1030,12 +1213,15 @@ def run_e2e_test(
     logger.info("=" * 60)
     logger.info(
         "\nTest Summary:\n"
-        f"  ✅ Phase 0: Prerequisites - All checks passed\n"
-        f"  ✅ Phase 1: Catalog Discovery - Asset: {asset_id}\n"
-        f"  ✅ Phase 2: Contract Negotiation - Agreement: {agreement_id}\n"
-        f"  ✅ Phase 3: Transfer Process - Transfer: {transfer_id}\n"
-        f"  ✅ Phase 4: Data Access - Data retrieved successfully\n"
-        "\nThe dataspace is functioning correctly!\n"
+        "  ✅ Phase 0: Prerequisites - All checks passed\n"
+        "  ✅ Phase 1: Catalog Discovery - Asset: %s\n"
+        "  ✅ Phase 2: Contract Negotiation - Agreement: %s\n"
+        "  ✅ Phase 3: Transfer Process - Transfer: %s\n"
+        "  ✅ Phase 4: Data Access - Data retrieved successfully\n"
+        "\nThe dataspace is functioning correctly!\n",
+        asset_id,
+        agreement_id,
+        transfer_id,
     )
 
     return True
@@ -1065,6 +1251,17 @@ def main():
         "--target-did",
         help="Target DID (default: provider's own DID)",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run prerequisite checks sequentially instead of concurrently",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        default=os.environ.get("EDC_FAIL_FAST") == "1",
+        help="Skip remaining prerequisite checks if services are unreachable",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -1092,6 +1289,8 @@ def main():
         target_address=args.target_address,
         target_did=args.target_did,
         skip_prerequisites=args.skip_prerequisites,
+        sequential=args.sequential,
+        fail_fast=args.fail_fast,
     )
 
     return 0 if success else 1
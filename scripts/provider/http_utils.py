@@ -2,18 +2,254 @@
 
 This module provides HTTP request utilities with consistent error handling,
 logging, and retry logic for interacting with various EDC component APIs.
+
+Requests are sent over persistent (keep-alive) connections that are kept per
+thread and per host, so consecutive calls to the same component reuse the
+same TCP connection instead of opening a new one for every request. Proxies
+configured in the environment (HTTP_PROXY, HTTPS_PROXY, NO_PROXY) are used,
+and redirects of GET and HEAD requests are followed, as urllib did.
 """
 
+import functools
+import http.client
 import json
 import logging
-import urllib.error
+import random
+import threading
+import time
+import urllib.parse
 import urllib.request
 from typing import Any, Dict, Optional, Tuple
 
-from config import HTTP_TIMEOUT_SECONDS
+from config import (
+    HTTP_RETRY_COUNT,
+    HTTP_RETRY_DELAY_SECONDS,
+    HTTP_RETRY_MAX_DELAY_SECONDS,
+    HTTP_TIMEOUT_SECONDS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Compact JSON encoder for request payloads (no whitespace between tokens)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Methods that are safe to send again after a failure. Other methods (POST)
+# are only retried when the caller opts in, e.g. for read-only query requests.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Redirect responses followed for GET and HEAD requests. Other methods get
+# the 3xx response back, since resending their body elsewhere is not safe.
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+
+# Per-thread pool of open connections keyed by (scheme, netloc).
+# http.client connections are not thread-safe, so each thread keeps its own.
+_connections = threading.local()
+
+
+def to_json(data: Any) -> str:
+    """
+    Serialize a request payload to compact JSON.
+
+    Args:
+        data: JSON-serializable payload
+
+    Returns:
+        JSON document without insignificant whitespace
+    """
+    return _JSON_ENCODER.encode(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_proxy(scheme: str, netloc: str) -> Optional[Tuple[str, Optional[int]]]:
+    """
+    Look up the environment proxy to use for a host, caching the result.
+
+    Honours the same HTTP_PROXY, HTTPS_PROXY and NO_PROXY variables as urllib.
+
+    Args:
+        scheme: URL scheme (http or https)
+        netloc: Host and optional port
+
+    Returns:
+        Tuple of (proxy host, proxy port), or None to connect directly
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(netloc):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    parsed = urllib.parse.urlsplit(proxy)
+    return parsed.hostname, parsed.port
+
+
+def _get_connection(
+    scheme: str, netloc: str, timeout: float
+) -> http.client.HTTPConnection:
+    """
+    Get a pooled connection for the given scheme and host, creating it if needed.
+
+    Args:
+        scheme: URL scheme (http or https)
+        netloc: Host and optional port
+        timeout: Socket timeout in seconds
+
+    Returns:
+        HTTP connection for the calling thread
+    """
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        proxy = _get_proxy(scheme, netloc)
+        if proxy is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=timeout)
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        elif scheme == "https":
+            conn = http.client.HTTPSConnection(*proxy, timeout=timeout)
+            conn.set_tunnel(netloc)
+        else:
+            conn = http.client.HTTPConnection(*proxy, timeout=timeout)
+        pool[(scheme, netloc)] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+    return conn
+
+
+@functools.lru_cache(maxsize=128)
+def _split_url(url: str) -> Tuple[str, str, str]:
+    """
+    Split a URL into the parts needed to send a request, caching the result.
+
+    Polling loops request the same URL many times, so it is parsed only once.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Tuple of (scheme, netloc, path including query string)
+    """
+    parsed = urllib.parse.urlsplit(url)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    return parsed.scheme, parsed.netloc, path
+
+
+def _send_once(
+    url: str,
+    method: str,
+    headers: Optional[Dict[str, str]],
+    body: Optional[bytes],
+    timeout: float,
+) -> Tuple[int, str, Optional[str], bytes]:
+    """
+    Send a single HTTP request over a pooled keep-alive connection.
+
+    A request on a reused connection that the server has already closed is
+    sent again once on a fresh connection, if the request could not be
+    written or is idempotent. A non-idempotent request whose response was
+    lost may already have been processed, so the error is raised instead.
+
+    Args:
+        url: Request URL
+        method: HTTP method
+        headers: Request headers
+        body: Request body (already encoded)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (status_code, reason, location_header, response_body)
+    """
+    scheme, netloc, path = _split_url(url)
+    if scheme == "http" and _get_proxy(scheme, netloc) is not None:
+        # Plain HTTP proxies expect the absolute URL as the request target
+        path = f"http://{netloc}{path}"
+
+    while True:
+        conn = _get_connection(scheme, netloc, timeout)
+        reused = conn.sock is not None
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            sent = True
+            response = conn.getresponse()
+            data = response.read()
+            return (
+                response.status,
+                response.reason,
+                response.getheader("Location"),
+                data,
+            )
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            conn.close()
+            if not reused or (sent and method not in IDEMPOTENT_METHODS):
+                raise
+            logger.debug("Stale connection to %s, reconnecting", netloc)
+        except Exception:
+            conn.close()
+            raise
+
+
+def send_request(
+    url: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    body: Optional[bytes] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[int, str, bytes]:
+    """
+    Send an HTTP request, reusing pooled keep-alive connections.
+
+    Redirects of GET and HEAD requests are followed up to MAX_REDIRECTS hops;
+    for other methods, or once the limit is reached, the 3xx response is
+    returned to the caller.
+
+    Args:
+        url: Request URL
+        method: HTTP method
+        headers: Request headers
+        body: Request body (already encoded)
+        timeout: Request timeout in seconds (default: HTTP_TIMEOUT_SECONDS)
+
+    Returns:
+        Tuple of (status_code, reason, response_body)
+
+    Raises:
+        OSError: On connection errors and timeouts
+        http.client.HTTPException: On malformed HTTP responses
+    """
+    if timeout is None:
+        timeout = HTTP_TIMEOUT_SECONDS
+
+    for _ in range(MAX_REDIRECTS):
+        status, reason, location, data = _send_once(
+            url, method, headers, body, timeout
+        )
+        if (
+            status not in REDIRECT_STATUSES
+            or not location
+            or method not in ("GET", "HEAD")
+        ):
+            break
+        url = urllib.parse.urljoin(url, location)
+        logger.debug("Following %s redirect to %s", status, url)
+    else:
+        status, reason, _, data = _send_once(url, method, headers, body, timeout)
+
+    return status, reason, data
+
 
 def make_request(
     url: str,
@@ -40,56 +276,135 @@ def make_request(
     Returns:
         Tuple of (success, response_body, status_code)
     """
-    logger.debug(f"{method} {url}")
-
-    if timeout is None:
-        timeout = HTTP_TIMEOUT_SECONDS
+    logger.debug("%s %s", method, url)
 
     try:
-        request_data = json.dumps(data).encode("utf-8") if data else None
-        req = urllib.request.Request(
-            url, data=request_data, headers=headers, method=method
+        request_data = to_json(data).encode("utf-8") if data else None
+        status_code, reason, body = send_request(
+            url, method, headers, request_data, timeout
         )
+        response_data = body.decode("utf-8")
 
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            response_data = response.read().decode("utf-8")
-            status_code = response.getcode()
+        if status_code in (200, 201, 204):
+            logger.info("✓ Successfully processed %s", entity_name)
+            logger.debug("Response: %s", response_data)
+            return True, response_data, status_code
 
-            if status_code in (200, 201, 204):
-                logger.info(f"✓ Successfully processed {entity_name}")
-                logger.debug(f"Response: {response_data}")
-                return True, response_data, status_code
-            else:
-                logger.warning(f"Unexpected status {status_code} for {entity_name}")
-                logger.debug(f"Response: {response_data}")
-                return False, response_data, status_code
+        if status_code == 409:
+            logger.info("✓ %s already exists", entity_name)
+            return True, response_data, status_code
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else "No error body"
+        if status_code >= 400:
+            error_body = response_data or "No error body"
+            logger.error("✗ HTTP %s error for %s: %s", status_code, entity_name, reason)
+            logger.error("Error body: %s", error_body)
+            return False, error_body, status_code
 
-        if e.code == 409:
-            logger.info(f"✓ {entity_name} already exists")
-            return True, error_body, e.code
-        else:
-            logger.error(f"✗ HTTP {e.code} error for {entity_name}: {e.reason}")
-            logger.error(f"Error body: {error_body}")
-            return False, error_body, e.code
+        logger.warning("Unexpected status %s for %s", status_code, entity_name)
+        logger.debug("Response: %s", response_data)
+        return False, response_data, status_code
 
-    except urllib.error.URLError as e:
-        logger.error(f"✗ URL error for {entity_name}: {e.reason}")
+    except OSError as e:
+        logger.error("✗ URL error for %s: %s", entity_name, e)
         return False, None, None
 
     except Exception as e:
-        logger.error(f"✗ Unexpected error for {entity_name}: {e}")
+        logger.error("✗ Unexpected error for %s: %s", entity_name, e)
         return False, None, None
 
 
+def _request_with_retries(
+    url: str,
+    method: str,
+    headers: Optional[Dict[str, str]],
+    data: Optional[str],
+    timeout: Optional[int],
+    retries: Optional[int],
+) -> Tuple[bool, int, bytes]:
+    """
+    Send a request, retrying transient failures with exponential backoff.
+
+    Transient failures (connection refused/reset and 5xx responses) are retried
+    with exponential backoff and jitter. Timeouts and 4xx responses (including
+    409 Conflict) are returned immediately. By default only idempotent methods
+    are retried, since repeating e.g. a POST that failed with a 5xx may create
+    the resource twice.
+
+    Args:
+        url: Request URL
+        method: HTTP method
+        headers: Request headers
+        data: Request body data (pre-encoded string)
+        timeout: Request timeout in seconds (default: HTTP_TIMEOUT_SECONDS)
+        retries: Number of retries on transient failures (default:
+            HTTP_RETRY_COUNT for idempotent methods, 0 otherwise)
+
+    Returns:
+        Tuple of (success, status_code, raw_response_body). On connection
+        errors the status code is 0 and the body holds the error message.
+    """
+    if retries is None:
+        retries = HTTP_RETRY_COUNT if method in IDEMPOTENT_METHODS else 0
+
+    request_data = data.encode("utf-8") if data else None
+
+    for attempt in range(retries + 1):
+        if attempt:
+            delay = min(
+                HTTP_RETRY_MAX_DELAY_SECONDS,
+                HTTP_RETRY_DELAY_SECONDS * 2 ** (attempt - 1),
+            ) + random.uniform(0, HTTP_RETRY_DELAY_SECONDS)
+            logger.debug(
+                "Retrying %s %s in %.1fs (attempt %d/%d)",
+                method,
+                url,
+                delay,
+                attempt + 1,
+                retries + 1,
+            )
+            time.sleep(delay)
+
+        try:
+            logger.debug("Making %s request to %s", method, url)
+
+            status_code, reason, body = send_request(
+                url, method, headers, request_data, timeout
+            )
+
+            if status_code >= 400:
+                error_body = body or f"HTTP Error {status_code}: {reason}".encode()
+                logger.debug(
+                    "HTTP Error %s: %s",
+                    status_code,
+                    error_body.decode("utf-8", "replace"),
+                )
+                result = False, status_code, error_body
+                if status_code >= 500:
+                    continue
+                return result
+
+            return True, status_code, body
+
+        except ConnectionError as e:
+            logger.debug("URL Error: %s", e)
+            result = False, 0, str(e).encode()
+        except OSError as e:
+            logger.debug("URL Error: %s", e)
+            return False, 0, str(e).encode()
+        except Exception as e:
+            logger.debug("Request Error: %s", e)
+            return False, 0, str(e).encode()
+
+    return result
+
+
 def make_http_request(
     url: str,
     method: str = "POST",
     headers: Optional[Dict[str, str]] = None,
     data: Optional[str] = None,
     timeout: Optional[int] = None,
+    retries: Optional[int] = None,
 ) -> Tuple[bool, int, str]:
     """
     Make HTTP request with error handling (alternative API, used by seed_participant).
@@ -97,48 +412,66 @@ def make_http_request(
     This is an alternative HTTP request function that accepts pre-encoded data.
     Use make_request() for most cases with automatic JSON encoding.
 
+    Transient failures of idempotent requests are retried, see
+    _request_with_retries().
+
     Args:
         url: Request URL
         method: HTTP method
         headers: Request headers
         data: Request body data (pre-encoded string)
         timeout: Request timeout in seconds (default: HTTP_TIMEOUT_SECONDS)
+        retries: Number of retries on transient failures (default:
+            HTTP_RETRY_COUNT for idempotent methods, 0 otherwise)
 
     Returns:
         Tuple of (success, status_code, response_body)
     """
-    if timeout is None:
-        timeout = HTTP_TIMEOUT_SECONDS
+    success, status_code, body = _request_with_retries(
+        url, method, headers, data, timeout, retries
+    )
+    return success, status_code, body.decode("utf-8", "replace")
 
-    try:
-        request = urllib.request.Request(url, method=method)
-
-        # Add headers
-        if headers:
-            for key, value in headers.items():
-                request.add_header(key, value)
-
-        # Add data for POST requests
-        if data:
-            request.data = data.encode("utf-8")
-
-        logger.debug(f"Making {method} request to {url}")
-
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            status_code = response.getcode()
-            response_body = response.read().decode("utf-8")
-            return True, status_code, response_body
-
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else str(e)
-        logger.debug(f"HTTP Error {e.code}: {error_body}")
-        return False, e.code, error_body
-    except urllib.error.URLError as e:
-        logger.debug(f"URL Error: {e.reason}")
-        return False, 0, str(e.reason)
-    except Exception as e:
-        logger.debug(f"Request Error: {e}")
-        return False, 0, str(e)
+
+def make_json_request(
+    url: str,
+    method: str = "POST",
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[str] = None,
+    timeout: Optional[int] = None,
+    retries: Optional[int] = None,
+) -> Tuple[bool, int, Any]:
+    """
+    Make HTTP request and parse the JSON response body.
+
+    Same as make_http_request(), but the raw response bytes are handed to the
+    JSON parser directly instead of being decoded to a string first.
+
+    Args:
+        url: Request URL
+        method: HTTP method
+        headers: Request headers
+        data: Request body data (pre-encoded string)
+        timeout: Request timeout in seconds (default: HTTP_TIMEOUT_SECONDS)
+        retries: Number of retries on transient failures (default:
+            HTTP_RETRY_COUNT for idempotent methods, 0 otherwise)
+
+    Returns:
+        Tuple of (success, status_code, parsed_body). If the request fails or
+        the body is not valid JSON, success is False and the body is returned
+        as a string.
+    """
+    success, status_code, body = _request_with_retries(
+        url, method, headers, data, timeout, retries
+    )
+
+    if success:
+        try:
+            return True, status_code, json.loads(body)
+        except ValueError:
+            logger.debug("Invalid JSON response from %s", url)
+
+    return False, status_code, body.decode("utf-8", "replace")
 
 
 def query_api(
@@ -161,7 +494,7 @@ def query_api(
     Returns:
         Parsed JSON response or None on failure
     """
-    logger.debug(f"Querying {entity_name}: {url}")
+    logger.debug("Querying %s: %s", entity_name, url)
 
     method = "POST" if query_body else "GET"
     success, response_body, status_code = make_request(
@@ -177,7 +510,7 @@ def query_api(
         try:
             return json.loads(response_body)
         except json.JSONDecodeError:
-            logger.error(f"Failed to parse JSON response for {entity_name}")
+            logger.error("Failed to parse JSON response for %s", entity_name)
             return None
 
     return None
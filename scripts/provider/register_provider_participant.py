@@ -209,26 +209,38 @@ def register_provider_participant(cfg: Config) -> bool:
         return False
 
 
+def run(cfg: Config) -> int:
+    """Register the Provider participant using an already loaded configuration.
+
+    Args:
+        cfg: Configuration object
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    logger.info("=" * 60)
+    logger.info("Register Provider as Participant in Identity Hub")
+    logger.info("=" * 60)
+
+    if register_provider_participant(cfg):
+        logger.info("✓ Provider participant registration complete")
+        return 0
+    logger.error("✗ Provider participant registration failed")
+    return 1
+
+
 def main() -> int:
     """Main entry point for Provider participant registration script."""
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
     )
 
-    logger.info("=" * 60)
-    logger.info("Register Provider as Participant in Identity Hub")
-    logger.info("=" * 60)
-
     cfg = load_config()
     if not cfg:
         logger.error("Failed to load configuration")
         return 1
 
-    if register_provider_participant(cfg):
-        logger.info("✓ Provider participant registration complete")
-        return 0
-    logger.error("✗ Provider participant registration failed")
-    return 1
+    return run(cfg)
 
 
 if __name__ == "__main__":
@@ -25,11 +25,9 @@ import urllib.parse
 import urllib.request
 from typing import List
 
-from config import load_config
+from http_utils import send_request
 
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from config import load_config
 
 logger = logging.getLogger(__name__)
 
@@ -76,28 +74,32 @@ def check_issuer_connectivity(config) -> bool:
     logger.debug(f"Checking Issuer connectivity at: {health_url}")
 
     try:
-        request = urllib.request.Request(health_url, method="GET")
-        with urllib.request.urlopen(request, timeout=5) as response:
-            if response.status == 200:
-                logger.info("✅ Issuer Service is reachable")
-                return True
-            else:
-                logger.warning(f"⚠️  Issuer returned unexpected status: {response.status}")
-                return False
-    except urllib.error.HTTPError as e:
-        # Some services return 404 for /health if not implemented, but that means it's reachable
-        if e.code in [404, 405]:
-            logger.info("✅ Issuer Service is reachable (no health endpoint)")
-            return True
-        logger.warning(f"⚠️  HTTP {e.code} error checking Issuer connectivity")
-        return False
-    except urllib.error.URLError as e:
-        logger.warning(f"⚠️  Cannot reach Issuer Service: {e.reason}")
+        status_code, _, _ = send_request(health_url, "GET", timeout=5)
+    except OSError as e:
+        logger.warning(f"⚠️  Cannot reach Issuer Service: {e}")
         return False
     except Exception as e:
         logger.warning(f"⚠️  Unexpected error checking Issuer connectivity: {e}")
         return False
 
+    if status_code == 200:
+        logger.info("✅ Issuer Service is reachable")
+        return True
+    # Redirects are not followed (e.g. an external Issuer redirecting HTTP to
+    # HTTPS), but any response means the service is reachable
+    if 300 <= status_code < 400:
+        logger.info(f"✅ Issuer Service is reachable (redirected: {status_code})")
+        return True
+    # Some services return 404 for /health if not implemented, but that means it's reachable
+    if status_code in [404, 405]:
+        logger.info("✅ Issuer Service is reachable (no health endpoint)")
+        return True
+    if status_code >= 400:
+        logger.warning(f"⚠️  HTTP {status_code} error checking Issuer connectivity")
+    else:
+        logger.warning(f"⚠️  Issuer returned unexpected status: {status_code}")
+    return False
+
 
 def poll_credential_status(config, status_url: str) -> bool:
     """
@@ -110,47 +112,68 @@ def poll_credential_status(config, status_url: str) -> bool:
     Returns:
         True if credentials were issued, False otherwise
     """
+    # Every poll goes to the same Identity Hub, so reuse one persistent
+    # connection instead of reconnecting on each attempt.
     headers = config.get_identity_superuser_headers()
+    headers["Connection"] = "keep-alive"
+
+    # Bind the names used on every iteration to locals once; the loop can run
+    # for POLL_MAX_ATTEMPTS iterations against a local Identity Hub.
+    # Messages use lazy %-style arguments so nothing is formatted when the
+    # level is disabled; the indented response dump is skipped entirely.
+    _send = send_request
+    _loads = json.loads
+    _sleep = time.sleep
+    _debug = logger.debug
+    _info = logger.info
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     for attempt in range(1, POLL_MAX_ATTEMPTS + 1):
-        logger.debug(f"Polling attempt {attempt}/{POLL_MAX_ATTEMPTS}...")
+        _debug("Polling attempt %d/%d...", attempt, POLL_MAX_ATTEMPTS)
 
         try:
-            request = urllib.request.Request(status_url, headers=headers, method="GET")
+            status_code, _, body = _send(
+                status_url, "GET", headers, timeout=HTTP_TIMEOUT
+            )
 
-            with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
-                status_data = json.loads(response.read().decode("utf-8"))
-                logger.debug(f"Status response: {json.dumps(status_data, indent=2)}")
+            if status_code >= 400:
+                error_body = body.decode("utf-8", "replace") or "No error details"
+                logger.error(
+                    "❌ HTTP %s error polling credential status", status_code
+                )
+                logger.error("Response: %s", error_body)
+                return False
 
-                status = status_data.get("status")
-                logger.info(f"Credential request status: {status}")
+            status_data = _loads(body)
+            if debug_enabled:
+                _debug("Status response: %s", json.dumps(status_data, indent=2))
 
-                if status == "ISSUED":
-                    logger.info("✅ Credentials have been issued successfully")
-                    return True
-                elif status in ["FAILED", "REJECTED"]:
-                    logger.error(f"❌ Credential request failed with status: {status}")
-                    return False
-                else:
-                    logger.debug(
-                        f"Status is '{status}', waiting {POLL_INTERVAL_SECONDS}s before next poll..."
-                    )
-                    time.sleep(POLL_INTERVAL_SECONDS)
+            status = status_data.get("status")
+            _info("Credential request status: %s", status)
 
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8") if e.fp else "No error details"
-            logger.error(f"❌ HTTP {e.code} error polling credential status")
-            logger.error(f"Response: {error_body}")
-            return False
-        except urllib.error.URLError as e:
-            logger.error(f"❌ Network error polling credential status: {e.reason}")
+            if status == "ISSUED":
+                _info("✅ Credentials have been issued successfully")
+                return True
+            elif status in ["FAILED", "REJECTED"]:
+                logger.error("❌ Credential request failed with status: %s", status)
+                return False
+            else:
+                _debug(
+                    "Status is '%s', waiting %ss before next poll...",
+                    status,
+                    POLL_INTERVAL_SECONDS,
+                )
+                _sleep(POLL_INTERVAL_SECONDS)
+
+        except OSError as e:
+            logger.error("❌ Network error polling credential status: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ Unexpected error polling credential status: {e}")
+            logger.error("❌ Unexpected error polling credential status: %s", e)
             return False
 
     logger.error(
-        f"❌ Credential status polling timed out after {POLL_MAX_ATTEMPTS} attempts"
+        "❌ Credential status polling timed out after %d attempts", POLL_MAX_ATTEMPTS
     )
     return False
 
@@ -262,14 +285,16 @@ def request_credentials_from_issuer(
         return False
 
 
-def main():
-    """Main entry point."""
-    # Load configuration
-    config = load_config()
-    if not config:
-        logger.error("Failed to load configuration")
-        return 1
+def run(config) -> int:
+    """
+    Request credentials using an already loaded configuration.
 
+    Args:
+        config: Configuration object
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
     # Check if Issuer deployment is disabled
     deploy_issuer = os.getenv("DEPLOY_ISSUER", "true").lower() == "true"
 
@@ -368,5 +393,20 @@ def main():
     return 0
 
 
+def main():
+    """Main entry point."""
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    # Load configuration
+    config = load_config()
+    if not config:
+        logger.error("Failed to load configuration")
+        return 1
+
+    return run(config)
+
+
 if __name__ == "__main__":
     sys.exit(main())
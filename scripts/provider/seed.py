@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Provider Participant Seeding Orchestration Script
+
+This is the main entry point for seeding the Provider participant in a single
+process. It runs the same steps as the individual provider scripts, but loads
+the configuration and sets up logging only once and shares them between steps.
+
+Seeding Sequence:
+    1. Register Provider as participant in its own Identity Hub
+    2. Create assets, policies, and contract definitions
+    3. Request credentials from the Issuer Service
+
+Usage:
+    python3 scripts/provider/seed.py
+
+Exit Codes:
+    0: Success - all seeding operations completed
+    1: Failure - one or more operations failed
+"""
+
+import logging
+import sys
+
+import register_provider_participant
+import request_credentials
+import seed_participant
+
+from config import load_config
+
+logger = logging.getLogger(__name__)
+
+
+def run_seeding_sequence() -> bool:
+    """
+    Execute the complete seeding sequence for the Provider participant.
+
+    Returns:
+        True if all steps succeed, False otherwise
+    """
+    config = load_config()
+    if not config:
+        logger.error("✗ Configuration loading failed")
+        return False
+
+    steps = [
+        ("Register Provider participant", register_provider_participant.run),
+        ("Seed assets, policies and contracts", seed_participant.run),
+        ("Request credentials", request_credentials.run),
+    ]
+
+    for step_name, step_func in steps:
+        if step_func(config) != 0:
+            logger.error("✗ %s failed", step_name)
+            return False
+        logger.info("✓ %s completed", step_name)
+
+    return True
+
+
+def main() -> int:
+    """
+    Main entry point for the seeding orchestration script.
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    try:
+        if run_seeding_sequence():
+            logger.info("=" * 60)
+            logger.info("✓ Provider participant seeding completed successfully")
+            logger.info("=" * 60)
+            return 0
+
+        logger.error("=" * 60)
+        logger.error("✗ Provider participant seeding failed")
+        logger.error("=" * 60)
+        return 1
+
+    except KeyboardInterrupt:
+        logger.warning("Seeding interrupted by user (Ctrl+C)")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,155 +18,298 @@ Components:
 
 Environment Variables:
     All PROVIDER_* environment variables from config.py
+    PROVIDER_READINESS_TIMEOUT_SECONDS  Max wait for Control Plane readiness
+                                        (default: 15)
 
 Based on:
     edc-mvds/deployment/postman/MVD.postman_collection.json
 """
 
-import json
 import logging
 import os
 import pprint
 import sys
-from typing import Dict, List, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
-from http_utils import make_http_request
+from http_utils import make_http_request, make_json_request, to_json
 
-from config import load_config
+from config import HTTP_RETRY_COUNT, load_config
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+logger = logging.getLogger(__name__)
+
+# Control Plane readiness probe: poll with a short per-request timeout until
+# ready or until the overall deadline (overridable via environment) expires
+ENV_READINESS_TIMEOUT = "PROVIDER_READINESS_TIMEOUT_SECONDS"
+DEFAULT_READINESS_TIMEOUT_SECONDS = 15.0
+READINESS_POLL_INTERVAL_SECONDS = 0.25
+READINESS_REQUEST_TIMEOUT_SECONDS = 1
+
+# Set once the Control Plane has been seen ready, so repeated availability
+# checks within the same process return immediately
+_provider_ready = False
+
+# Maximum number of concurrent create requests within a single category
+SEED_MAX_WORKERS = 8
+
+# Management API query body, serialized once
+QUERY_SPEC_BODY = to_json(
+    {
+        "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
+        "@type": "QuerySpec",
+    }
 )
 
-logger = logging.getLogger(__name__)
+# Policy definitions based on edc-mvds Postman collection. They do not depend
+# on configuration, so they are built once at import time.
+POLICY_DEFINITIONS: Tuple[Dict, ...] = (
+    {
+        "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
+        "@type": "PolicyDefinition",
+        "@id": "allow-all",
+        "policy": {
+            "@type": "Set",
+            "permission": [
+                {
+                    "action": "use",
+                }
+            ],
+        },
+    },
+    {
+        "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
+        "@type": "PolicyDefinition",
+        "@id": "require-membership",
+        "policy": {
+            "@type": "Set",
+            "permission": [
+                {
+                    "action": "use",
+                    "constraint": {
+                        "leftOperand": "MembershipCredential",
+                        "operator": "eq",
+                        "rightOperand": "active",
+                    },
+                }
+            ],
+        },
+    },
+    {
+        "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
+        "@type": "PolicyDefinition",
+        "@id": "require-dataprocessor",
+        "policy": {
+            "@type": "Set",
+            "obligation": [
+                {
+                    "action": "use",
+                    "constraint": {
+                        "leftOperand": "DataAccess.level",
+                        "operator": "eq",
+                        "rightOperand": "processing",
+                    },
+                }
+            ],
+        },
+    },
+    {
+        "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
+        "@type": "PolicyDefinition",
+        "@id": "require-sensitive",
+        "policy": {
+            "@type": "Set",
+            "obligation": [
+                {
+                    "action": "use",
+                    "constraint": {
+                        "leftOperand": "DataAccess.level",
+                        "operator": "eq",
+                        "rightOperand": "sensitive",
+                    },
+                }
+            ],
+        },
+    },
+)
+
+
+def get_readiness_timeout() -> float:
+    """
+    Get the overall time budget for the Control Plane readiness check.
+
+    Returns:
+        Timeout in seconds (PROVIDER_READINESS_TIMEOUT_SECONDS or the default)
+    """
+    value = os.environ.get(ENV_READINESS_TIMEOUT)
+    if not value:
+        return DEFAULT_READINESS_TIMEOUT_SECONDS
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        logger.warning(
+            "Invalid %s value %r, using default of %ss",
+            ENV_READINESS_TIMEOUT,
+            value,
+            DEFAULT_READINESS_TIMEOUT_SECONDS,
+        )
+        return DEFAULT_READINESS_TIMEOUT_SECONDS
 
 
 def check_provider_availability(config) -> bool:
     """
     Check if provider Control Plane is available.
 
+    Polls the readiness endpoint with a short request timeout, returning as
+    soon as the Control Plane reports ready and giving up once the readiness
+    timeout expires. A positive result is cached for the rest of the process.
+
     Args:
         config: Configuration object
 
     Returns:
         True if provider is available, False otherwise
     """
+    global _provider_ready
+
+    if _provider_ready:
+        return True
+
     logger.info("Checking provider Control Plane availability...")
 
-    health_url = f"http://localhost:{config.provider_cp_web_port}/api/check/health"
+    readiness_url = (
+        f"http://localhost:{config.provider_cp_web_port}/api/check/readiness"
+    )
+    deadline = time.monotonic() + get_readiness_timeout()
 
-    success, status_code, response = make_http_request(health_url, "GET")
+    while True:
+        success, status_code, response = make_http_request(
+            readiness_url,
+            "GET",
+            timeout=READINESS_REQUEST_TIMEOUT_SECONDS,
+            retries=0,
+        )
 
-    if success and status_code == 200:
-        logger.info("✅ Provider Control Plane is available")
-        return True
-    else:
-        logger.error(f"❌ Provider Control Plane is not available: {status_code}")
-        logger.error("Make sure provider services are running: task provider:up")
-        return False
+        if success and status_code == 200:
+            logger.info("✅ Provider Control Plane is available")
+            _provider_ready = True
+            return True
+
+        if time.monotonic() + READINESS_POLL_INTERVAL_SECONDS > deadline:
+            break
+
+        logger.debug("⏳ Provider Control Plane not ready yet: %s", status_code)
+        time.sleep(READINESS_POLL_INTERVAL_SECONDS)
 
+    logger.error("❌ Provider Control Plane is not available: %s", status_code)
+    logger.error("Make sure provider services are running: task provider:up")
+    return False
 
-def create_asset(config, asset_data: Dict) -> bool:
+
+def create_asset(config, asset_data: Dict, headers: Dict[str, str]) -> bool:
     """
     Create a data asset.
 
     Args:
         config: Configuration object
         asset_data: Asset definition
+        headers: Management API headers
 
     Returns:
         True if successful, False otherwise
     """
     asset_id = asset_data.get("@id", "unknown")
-    logger.info(f"Creating asset: {asset_id}")
+    logger.info("Creating asset: %s", asset_id)
 
     url = f"http://localhost:{config.provider_cp_management_port}/api/management/v3/assets"
-    headers = config.get_management_headers()
 
     success, status_code, response = make_http_request(
-        url, "POST", headers, json.dumps(asset_data)
+        url, "POST", headers, to_json(asset_data)
     )
 
     if status_code == 409:
-        logger.info(f"✅ Asset {asset_id} already exists")
+        logger.info("✅ Asset %s already exists", asset_id)
         return True
     elif success and status_code in [200, 204]:
-        logger.info(f"✅ Asset {asset_id} created successfully")
+        logger.info("✅ Asset %s created successfully", asset_id)
         return True
     else:
-        logger.error(f"❌ Failed to create asset {asset_id}: {status_code}")
+        logger.error("❌ Failed to create asset %s: %s", asset_id, status_code)
         if response:
-            logger.debug(f"Error response: {response}")
+            logger.debug("Error response: %s", response)
         return False
 
 
-def create_policy(config, policy_data: Dict) -> bool:
+def create_policy(config, policy_data: Dict, headers: Dict[str, str]) -> bool:
     """
     Create a policy definition.
 
     Args:
         config: Configuration object
         policy_data: Policy definition
+        headers: Management API headers
 
     Returns:
         True if successful, False otherwise
     """
     policy_id = policy_data.get("@id", "unknown")
-    logger.info(f"Creating policy: {policy_id}")
+    logger.info("Creating policy: %s", policy_id)
 
     url = f"http://localhost:{config.provider_cp_management_port}/api/management/v3/policydefinitions"
-    headers = config.get_management_headers()
 
     success, status_code, response = make_http_request(
-        url, "POST", headers, json.dumps(policy_data)
+        url, "POST", headers, to_json(policy_data)
     )
 
     if status_code == 409:
-        logger.info(f"✅ Policy {policy_id} already exists")
+        logger.info("✅ Policy %s already exists", policy_id)
         return True
     elif success and status_code in [200, 204]:
-        logger.info(f"✅ Policy {policy_id} created successfully")
+        logger.info("✅ Policy %s created successfully", policy_id)
         return True
     else:
-        logger.error(f"❌ Failed to create policy {policy_id}: {status_code}")
+        logger.error("❌ Failed to create policy %s: %s", policy_id, status_code)
         if response:
-            logger.debug(f"Error response: {response}")
+            logger.debug("Error response: %s", response)
         return False
 
 
-def create_contract_definition(config, contract_data: Dict) -> bool:
+def create_contract_definition(
+    config, contract_data: Dict, headers: Dict[str, str]
+) -> bool:
     """
     Create a contract definition.
 
     Args:
         config: Configuration object
         contract_data: Contract definition
+        headers: Management API headers
 
     Returns:
         True if successful, False otherwise
     """
     contract_id = contract_data.get("@id", "unknown")
-    logger.info(f"Creating contract definition: {contract_id}")
+    logger.info("Creating contract definition: %s", contract_id)
 
     url = f"http://localhost:{config.provider_cp_management_port}/api/management/v3/contractdefinitions"
-    headers = config.get_management_headers()
 
     success, status_code, response = make_http_request(
-        url, "POST", headers, json.dumps(contract_data)
+        url, "POST", headers, to_json(contract_data)
     )
 
     if status_code == 409:
-        logger.info(f"✅ Contract definition {contract_id} already exists")
+        logger.info("✅ Contract definition %s already exists", contract_id)
         return True
     elif success and status_code in [200, 204]:
-        logger.info(f"✅ Contract definition {contract_id} created successfully")
+        logger.info("✅ Contract definition %s created successfully", contract_id)
         return True
     else:
         logger.error(
-            f"❌ Failed to create contract definition {contract_id}: {status_code}"
+            "❌ Failed to create contract definition %s: %s", contract_id, status_code
         )
         if response:
-            logger.debug(f"Error response: {response}")
+            logger.debug("Error response: %s", response)
         return False
 
 
@@ -190,75 +333,7 @@ def get_policy_definitions() -> List[Dict]:
     Returns:
         List of policy definitions
     """
-    return [
-        {
-            "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
-            "@type": "PolicyDefinition",
-            "@id": "allow-all",
-            "policy": {
-                "@type": "Set",
-                "permission": [
-                    {
-                        "action": "use",
-                    }
-                ],
-            },
-        },
-        {
-            "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
-            "@type": "PolicyDefinition",
-            "@id": "require-membership",
-            "policy": {
-                "@type": "Set",
-                "permission": [
-                    {
-                        "action": "use",
-                        "constraint": {
-                            "leftOperand": "MembershipCredential",
-                            "operator": "eq",
-                            "rightOperand": "active",
-                        },
-                    }
-                ],
-            },
-        },
-        {
-            "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
-            "@type": "PolicyDefinition",
-            "@id": "require-dataprocessor",
-            "policy": {
-                "@type": "Set",
-                "obligation": [
-                    {
-                        "action": "use",
-                        "constraint": {
-                            "leftOperand": "DataAccess.level",
-                            "operator": "eq",
-                            "rightOperand": "processing",
-                        },
-                    }
-                ],
-            },
-        },
-        {
-            "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
-            "@type": "PolicyDefinition",
-            "@id": "require-sensitive",
-            "policy": {
-                "@type": "Set",
-                "obligation": [
-                    {
-                        "action": "use",
-                        "constraint": {
-                            "leftOperand": "DataAccess.level",
-                            "operator": "eq",
-                            "rightOperand": "sensitive",
-                        },
-                    }
-                ],
-            },
-        },
-    ]
+    return list(POLICY_DEFINITIONS)
 
 
 def get_contract_definitions(config) -> List[Dict]:
@@ -292,7 +367,7 @@ def get_contract_definitions(config) -> List[Dict]:
                 asset_num = int(asset_num_str)
                 asset_numbers.add(asset_num)
             except ValueError:
-                logger.warning(f"Invalid asset environment variable format: {env_var}")
+                logger.warning("Invalid asset environment variable format: %s", env_var)
                 continue
 
     # Generate contract definition for each asset
@@ -301,7 +376,7 @@ def get_contract_definitions(config) -> List[Dict]:
 
         if not asset_id:
             logger.warning(
-                f"Asset {asset_num}: Missing ID, skipping contract definition"
+                "Asset %s: Missing ID, skipping contract definition", asset_num
             )
             continue
 
@@ -345,18 +420,55 @@ def get_contract_definitions(config) -> List[Dict]:
         )
     else:
         logger.info(
-            f"Generated {len(contract_definitions)} contract definitions from asset configuration"
+            "Generated %s contract definitions from asset configuration",
+            len(contract_definitions),
         )
 
     return contract_definitions
 
 
-def seed_assets(config) -> bool:
+def create_all(
+    config,
+    items: List[Dict],
+    create_func: Callable,
+    headers: Dict[str, str],
+) -> bool:
+    """
+    Create all items of one category concurrently.
+
+    Items within a category are independent, so their create requests are
+    issued in parallel; items that already exist are answered with 409 and
+    count as created. Categories themselves must still be seeded in order
+    (contracts reference assets and policies).
+
+    Args:
+        config: Configuration object
+        items: Definitions to create
+        create_func: Function creating a single item, e.g. create_asset
+        headers: Management API headers
+
+    Returns:
+        True if all items were created (or already existed), False otherwise
+    """
+    if not items:
+        return True
+
+    workers = min(SEED_MAX_WORKERS, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(lambda item: create_func(config, item, headers), items)
+        )
+
+    return all(results)
+
+
+def seed_assets(config, headers: Dict[str, str]) -> bool:
     """
     Seed provider with data assets.
 
     Args:
         config: Configuration object
+        headers: Management API headers
 
     Returns:
         True if successful, False otherwise
@@ -364,26 +476,23 @@ def seed_assets(config) -> bool:
     logger.info("Seeding data assets...")
 
     assets = get_asset_definitions(config)
-    all_successful = True
-
-    for asset in assets:
-        if not create_asset(config, asset):
-            all_successful = False
+    all_successful = create_all(config, assets, create_asset, headers)
 
     if all_successful:
-        logger.info(f"✅ All {len(assets)} assets created successfully")
+        logger.info("✅ All %s assets created successfully", len(assets))
     else:
         logger.error("❌ Some assets failed to create")
 
     return all_successful
 
 
-def seed_policies(config) -> bool:
+def seed_policies(config, headers: Dict[str, str]) -> bool:
     """
     Seed provider with policy definitions.
 
     Args:
         config: Configuration object
+        headers: Management API headers
 
     Returns:
         True if successful, False otherwise
@@ -391,26 +500,23 @@ def seed_policies(config) -> bool:
     logger.info("Seeding policy definitions...")
 
     policies = get_policy_definitions()
-    all_successful = True
-
-    for policy in policies:
-        if not create_policy(config, policy):
-            all_successful = False
+    all_successful = create_all(config, policies, create_policy, headers)
 
     if all_successful:
-        logger.info(f"✅ All {len(policies)} policies created successfully")
+        logger.info("✅ All %s policies created successfully", len(policies))
     else:
         logger.error("❌ Some policies failed to create")
 
     return all_successful
 
 
-def seed_contracts(config) -> bool:
+def seed_contracts(config, headers: Dict[str, str]) -> bool:
     """
     Seed provider with contract definitions.
 
     Args:
         config: Configuration object
+        headers: Management API headers
 
     Returns:
         True if successful, False otherwise
@@ -418,15 +524,11 @@ def seed_contracts(config) -> bool:
     logger.info("Seeding contract definitions...")
 
     contracts = get_contract_definitions(config)
-    all_successful = True
-
-    for contract in contracts:
-        if not create_contract_definition(config, contract):
-            all_successful = False
+    all_successful = create_all(config, contracts, create_contract_definition, headers)
 
     if all_successful:
         logger.info(
-            f"✅ All {len(contracts)} contract definitions created successfully"
+            "✅ All %s contract definitions created successfully", len(contracts)
         )
     else:
         logger.error("❌ Some contract definitions failed to create")
@@ -434,12 +536,13 @@ def seed_contracts(config) -> bool:
     return all_successful
 
 
-def verify_seeded_data(config) -> bool:
+def verify_seeded_data(config, headers: Dict[str, str]) -> bool:
     """
     Verify seeded data by querying the Management API.
 
     Args:
         config: Configuration object
+        headers: Management API headers
 
     Returns:
         True if verification successful, False otherwise
@@ -462,43 +565,46 @@ def verify_seeded_data(config) -> bool:
         ),
     ]
 
-    headers = config.get_management_headers()
-    query_body = json.dumps(
-        {
-            "@context": ["https://w3id.org/edc/connector/management/v0.0.1"],
-            "@type": "QuerySpec",
-        }
-    )
+    # The three queries are independent, so issue them concurrently and
+    # report the results in the original order
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        results = list(
+            executor.map(
+                lambda endpoint: make_json_request(
+                    endpoint[1],
+                    "POST",
+                    headers,
+                    QUERY_SPEC_BODY,
+                    retries=HTTP_RETRY_COUNT,
+                ),
+                endpoints,
+            )
+        )
 
     all_successful = True
 
-    for endpoint_name, url in endpoints:
-        success, status_code, response = make_http_request(
-            url, "POST", headers, query_body
-        )
-
+    for (endpoint_name, _), (success, status_code, data) in zip(endpoints, results):
         if success and status_code == 200:
-            try:
-                data = json.loads(response)
-                if isinstance(data, list):
-                    logger.info(f"✅ {endpoint_name}: {len(data)} items found")
-                else:
-                    logger.info(f"✅ {endpoint_name}: response received")
-            except json.JSONDecodeError:
-                logger.warning(f"⚠️  {endpoint_name}: non-JSON response")
+            if isinstance(data, list):
+                logger.info("✅ %s: %s items found", endpoint_name, len(data))
+            else:
+                logger.info("✅ %s: response received", endpoint_name)
+        elif status_code == 200:
+            logger.warning("⚠️  %s: non-JSON response", endpoint_name)
         else:
-            logger.error(f"❌ {endpoint_name} verification failed: {status_code}")
+            logger.error("❌ %s verification failed: %s", endpoint_name, status_code)
             all_successful = False
 
     return all_successful
 
 
-def seed_all_components(config) -> bool:
+def seed_all_components(config, headers: Dict[str, str]) -> bool:
     """
     Seed all provider components.
 
     Args:
         config: Configuration object
+        headers: Management API headers
 
     Returns:
         True if successful, False otherwise
@@ -516,20 +622,20 @@ def seed_all_components(config) -> bool:
     all_successful = True
 
     for step_name, step_func in seeding_steps:
-        logger.info(f"\n--- {step_name} ---")
+        logger.info("\n--- %s ---", step_name)
         try:
-            if step_func(config):
-                logger.info(f"✅ {step_name} seeding completed")
+            if step_func(config, headers):
+                logger.info("✅ %s seeding completed", step_name)
             else:
-                logger.error(f"❌ {step_name} seeding failed")
+                logger.error("❌ %s seeding failed", step_name)
                 all_successful = False
         except Exception as e:
-            logger.error(f"❌ {step_name} seeding failed with exception: {e}")
+            logger.error("❌ %s seeding failed with exception: %s", step_name, e)
             all_successful = False
 
     # Verification
-    logger.info(f"\n--- Verification ---")
-    if verify_seeded_data(config):
+    logger.info("\n--- Verification ---")
+    if verify_seeded_data(config, headers):
         logger.info("✅ Seeded data verification passed")
     else:
         logger.warning("⚠️  Seeded data verification had issues")
@@ -562,43 +668,65 @@ def show_help():
     print(__doc__)
 
 
-def main():
-    """Main entry point."""
-    # Load configuration
-    config = load_config()
-    if not config:
-        logger.error("Failed to load configuration")
-        return 1
+def run(config, component: str = "all") -> int:
+    """
+    Seed the given component using an already loaded configuration.
+
+    Args:
+        config: Configuration object
+        component: Component to seed (assets, policies, contracts, verify, all)
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    if component == "help" or component == "--help":
+        show_help()
+        return 0
 
     # Check provider availability
     if not check_provider_availability(config):
         return 1
 
-    # Determine component to seed
-    component = sys.argv[1].lower() if len(sys.argv) > 1 else "all"
-
     success = False
 
+    # Build the request headers once and share them across all API calls
+    headers = config.get_management_headers()
+
     if component == "assets":
-        success = seed_assets(config)
+        success = seed_assets(config, headers)
     elif component == "policies":
-        success = seed_policies(config)
+        success = seed_policies(config, headers)
     elif component == "contracts":
-        success = seed_contracts(config)
+        success = seed_contracts(config, headers)
     elif component == "verify":
-        success = verify_seeded_data(config)
+        success = verify_seeded_data(config, headers)
     elif component == "all":
-        success = seed_all_components(config)
-    elif component == "help" or component == "--help":
-        show_help()
-        return 0
+        success = seed_all_components(config, headers)
     else:
-        logger.error(f"Unknown component: {component}")
+        logger.error("Unknown component: %s", component)
         show_help()
         return 1
 
     return 0 if success else 1
 
 
+def main():
+    """Main entry point."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    # Load configuration
+    config = load_config()
+    if not config:
+        logger.error("Failed to load configuration")
+        return 1
+
+    # Determine component to seed
+    component = sys.argv[1].lower() if len(sys.argv) > 1 else "all"
+
+    return run(config, component)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -20,9 +20,12 @@ Requirements:
 import logging
 import os
 import re
+import stat
 import sys
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, DefaultDict, Dict, List, Optional, Set, Tuple
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -37,6 +40,25 @@ CONFIG_FILES = [
     "provider-identityhub.env",
 ]
 
+# One match per line of a .env file: a comment, a KEY=VALUE assignment (key and
+# value without surrounding whitespace) or any other, invalid, line
+ENV_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*(?:#.*|(?P<key>[^=\n]*?)[^\S\n]*=[^\S\n]*(?P<value>.*?)|(?P<other>.*?))"
+    r"[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Variables whose name ends with this suffix hold a port number. This is a
+# suffix test rather than a fixed set because the generated files contain
+# port variables that are not required (e.g. WEB_HTTP_IDENTITY_PORT).
+PORT_VAR_SUFFIX = "_PORT"
+
+# Expected database connection string format
+DB_URL_PATTERN = re.compile(r"^jdbc:postgresql://[^:]+:\d+/\w+$")
+
+# did:web DID, optionally with an encoded port and a path
+DID_PATTERN = re.compile(r"^did:web:[^:]+(?:%3A\d+)?(?::[^:]+)?$")
+
 # Required environment variables for each component
 REQUIRED_VARS = {
     "provider-controlplane.env": [
@@ -72,77 +94,69 @@ REQUIRED_VARS = {
     ],
 }
 
+# Final message when all validations pass, logged as a single record
+SUCCESS_BANNER = "\n".join(
+    [
+        "🎉 All configuration validations passed!",
+        "",
+        "Configuration files are ready for deployment:",
+        *(f"  ✅ {filename}" for filename in CONFIG_FILES),
+        "",
+        "Next steps:",
+        "  1. Start provider services with Docker Compose",
+        "  2. Verify component health checks",
+        "  3. Test API endpoints",
+    ]
+)
 
-def load_env_file(file_path: Path) -> Dict[str, str]:
-    """
-    Load environment variables from a .env file.
-
-    Args:
-        file_path: Path to .env file
-
-    Returns:
-        Dictionary of environment variables
-    """
-    env_vars = {}
-
-    try:
-        with open(file_path, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-
-                # Parse KEY=VALUE format
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    env_vars[key.strip()] = value.strip()
-                else:
-                    logger.warning(
-                        f"Invalid line format in {file_path}:{line_num}: {line}"
-                    )
-
-        return env_vars
-
-    except Exception as e:
-        logger.error(f"Failed to load {file_path}: {str(e)}")
-        return {}
+# Same as REQUIRED_VARS for membership tests while parsing; the lists above
+# keep the order used in error messages
+REQUIRED_VAR_SETS = {
+    filename: frozenset(variables) for filename, variables in REQUIRED_VARS.items()
+}
 
 
-def validate_file_exists(file_path: Path) -> bool:
+def validate_file_exists(file_path: Path, dir_fd: Optional[int] = None) -> bool:
     """
     Validate that configuration file exists and is readable.
 
     Args:
         file_path: Path to configuration file
+        dir_fd: Open descriptor of the directory containing the file. If
+            given, the file is looked up by name relative to it.
 
     Returns:
         True if file exists and is readable, False otherwise
     """
-    if not file_path.exists():
+    path = file_path.name if dir_fd is not None else file_path
+
+    # A single stat call answers both the existence and the file type checks
+    try:
+        st = os.stat(path, dir_fd=dir_fd)
+    except (FileNotFoundError, NotADirectoryError):
         logger.error(f"❌ Configuration file not found: {file_path}")
         return False
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         logger.error(f"❌ Path is not a file: {file_path}")
         return False
 
-    if not os.access(file_path, os.R_OK):
+    if not os.access(path, os.R_OK, dir_fd=dir_fd):
         logger.error(f"❌ Configuration file is not readable: {file_path}")
         return False
 
-    logger.info(f"✅ Configuration file exists: {file_path.name}")
+    logger.info("✅ Configuration file exists: %s", file_path.name)
     return True
 
 
-def validate_required_variables(filename: str, env_vars: Dict[str, str]) -> bool:
+def report_required_variables(filename: str, missing: List[str]) -> bool:
     """
-    Validate that all required environment variables are present.
+    Report required environment variables missing from a configuration file.
 
     Args:
         filename: Configuration filename
-        env_vars: Loaded environment variables
+        missing: Required variables that are missing or empty, as returned
+            by load_env_file
 
     Returns:
         True if all required variables present, False otherwise
@@ -151,20 +165,13 @@ def validate_required_variables(filename: str, env_vars: Dict[str, str]) -> bool
         logger.warning(f"⚠️  No validation rules for {filename}")
         return True
 
-    required = REQUIRED_VARS[filename]
-    missing = []
-
-    for var in required:
-        if var not in env_vars or not env_vars[var]:
-            missing.append(var)
-
     if missing:
         logger.error(
             f"❌ Missing required variables in {filename}: {', '.join(missing)}"
         )
         return False
 
-    logger.info(f"✅ All required variables present in {filename}")
+    logger.info("✅ All required variables present in %s", filename)
     return True
 
 
@@ -178,181 +185,353 @@ def validate_port_format(port_value: str) -> bool:
     Returns:
         True if port is valid, False otherwise
     """
-    try:
-        port = int(port_value)
-        return 1 <= port <= 65535
-    except ValueError:
-        return False
+    # isdecimal() accepts exactly the digits int() does, so a malformed value
+    # is rejected without raising and handling a ValueError
+    return port_value.isdecimal() and 1 <= int(port_value) <= 65535
+
+
+class CrossComponentState:
+    """Values collected in the single pass over all loaded configuration files."""
+
+    def __init__(self) -> None:
+        # Errors are stored as the already formatted lines of their report
+        self.invalid_ports: List[str] = []
+        # Track which files use which ports. A port is flagged as conflicting
+        # as soon as a second config file (i.e. a different service) uses it;
+        # reuse within the same service is allowed.
+        self.port_to_files: DefaultDict[str, List[Tuple[str, str]]] = defaultdict(
+            list
+        )
+        self.conflicting_ports: Set[str] = set()
+        self.invalid_urls: List[str] = []
+        self.invalid_dids: List[str] = []
+        # DIDs and Vault settings must be the same in every file, so only the
+        # first value seen and the first one differing from it are kept
+        self.did: Optional[str] = None
+        self.conflicting_did: Optional[str] = None
+        self.vault_url: Optional[str] = None
+        self.conflicting_vault_url: Optional[str] = None
+        self.vault_token: Optional[str] = None
+        self.conflicting_vault_token: Optional[str] = None
+
+
+def _check_port(
+    state: CrossComponentState, filename: str, var_name: str, var_value: str
+) -> None:
+    """Record an invalid port or a port already used by another file."""
+    if not validate_port_format(var_value):
+        state.invalid_ports.append(f"   {filename}: {var_name}={var_value}")
+        return
+
+    # Files are processed one at a time, so a port first used in another file
+    # is a cross-service conflict
+    file_vars = state.port_to_files[var_value]
+    if file_vars and file_vars[0][0] != filename:
+        state.conflicting_ports.add(var_value)
+    file_vars.append((filename, var_name))
+
+
+def _check_database_url(
+    state: CrossComponentState, filename: str, var_name: str, var_value: str
+) -> None:
+    """Record a database URL that does not match the expected format."""
+    if not DB_URL_PATTERN.match(var_value):
+        state.invalid_urls.append(f"   {filename}: {var_value}")
+
+
+def _check_did(
+    state: CrossComponentState, filename: str, var_name: str, var_value: str
+) -> None:
+    """Record a DID, or an invalid one if it is not a did:web DID."""
+    if not DID_PATTERN.match(var_value):
+        state.invalid_dids.append(f"   {filename}: {var_name}={var_value}")
+    elif state.did is None:
+        state.did = var_value
+    elif var_value != state.did and state.conflicting_did is None:
+        state.conflicting_did = var_value
+
+
+def _collect_vault_url(
+    state: CrossComponentState, filename: str, var_name: str, var_value: str
+) -> None:
+    """Record a non-empty Vault URL."""
+    if not var_value:
+        return
+
+    if state.vault_url is None:
+        state.vault_url = var_value
+    elif var_value != state.vault_url and state.conflicting_vault_url is None:
+        state.conflicting_vault_url = var_value
+
+
+def _collect_vault_token(
+    state: CrossComponentState, filename: str, var_name: str, var_value: str
+) -> None:
+    """Record a non-empty Vault token."""
+    if not var_value:
+        return
+
+    if state.vault_token is None:
+        state.vault_token = var_value
+    elif var_value != state.vault_token and state.conflicting_vault_token is None:
+        state.conflicting_vault_token = var_value
+
+
+# Per-variable checks applied while parsing each file in load_env_file. Variables
+# not listed here are checked as ports if their name ends with PORT_VAR_SUFFIX.
+HANDLERS: Dict[str, Callable[[CrossComponentState, str, str, str], None]] = {
+    "EDC_DATASOURCE_DEFAULT_URL": _check_database_url,
+    "EDC_VAULT_HASHICORP_URL": _collect_vault_url,
+    "EDC_VAULT_HASHICORP_TOKEN": _collect_vault_token,
+    "EDC_PARTICIPANT_ID": _check_did,
+    "EDC_IH_IAM_ID": _check_did,
+}
 
 
-def validate_ports(all_env_vars: Dict[str, Dict[str, str]]) -> bool:
+def read_env_file(file_path: Path, dir_fd: Optional[int] = None) -> str:
     """
-    Validate port configurations across all components.
+    Read a whole .env file.
 
     Args:
-        all_env_vars: Dictionary mapping filenames to their env vars
+        file_path: Path to .env file
+        dir_fd: Open descriptor of the directory containing the file. If
+            given, the file is opened by name relative to it.
 
     Returns:
-        True if all ports are valid, False otherwise
+        Decoded file content
+
+    Raises:
+        OSError: If the file cannot be opened or is not a regular file
     """
-    logger.info("Validating port configurations...")
+    path = file_path.name if dir_fd is not None else file_path
+
+    # Reads are submitted before validate_file_exists has checked the path, so
+    # open without blocking (e.g. on a FIFO) and only read regular files
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK, dir_fd=dir_fd)
+    with open(fd, "rb") as f:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            raise OSError(f"Not a regular file: {file_path}")
 
-    all_ports: Set[str] = set()
-    port_conflicts: List[Tuple[str, str, str]] = []
-    invalid_ports: List[Tuple[str, str, str]] = []
+        # Read the whole (small) file with a single read call and parse it in
+        # memory instead of iterating over the file object line by line
+        return f.read().decode("utf-8")
 
-    # Collect all ports from all components
-    port_to_files: Dict[str, List[Tuple[str, str]]] = {}
 
-    for filename, env_vars in all_env_vars.items():
-        for var_name, var_value in env_vars.items():
-            if var_name.endswith("_PORT") or var_name.endswith("PORT") and not var_name.endswith("_URL"):
-                # Validate port format
-                if not validate_port_format(var_value):
-                    invalid_ports.append((filename, var_name, var_value))
+def load_env_file(
+    file_path: Path,
+    state: Optional[CrossComponentState],
+    pending_read: Optional["Future[str]"] = None,
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Load environment variables from a .env file, checking them as they are parsed.
+
+    Each assignment is ticked off the file's required variables and passed to
+    the cross-component checks in the same loop that parses it, so the file is
+    walked only once. The checks are recorded in state and reported later.
+
+    Args:
+        file_path: Path to .env file
+        state: Values collected from all configuration files, or None to
+            skip the cross-component checks
+        pending_read: Already submitted read_env_file call for file_path,
+            if any
+
+    Returns:
+        Tuple of (dictionary of environment variables, required variables
+        that are missing or empty)
+    """
+    filename = file_path.name
+    env_vars = {}
+    required = REQUIRED_VAR_SETS.get(filename, frozenset())
+    missing = set(required)
+
+    try:
+        if pending_read is not None:
+            content = pending_read.result()
+        else:
+            content = read_env_file(file_path)
+
+        # The pattern only splits on "\n"; normalize CRLF and lone CR endings
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        # Scan all lines with one compiled pattern; comments and empty lines
+        # match with neither a key nor other content and are skipped
+        for match in ENV_LINE_PATTERN.finditer(content):
+            key = match.group("key")
+            if key is not None:
+                # Interned keys compare by identity with the (interned) name
+                # literals of REQUIRED_VAR_SETS and HANDLERS in the lookups below
+                key = sys.intern(key)
+                value = match.group("value")
+                env_vars[key] = value
+
+                if key in required:
+                    if value:
+                        missing.discard(key)
+                    else:
+                        missing.add(key)
+
+                if state is None:
                     continue
 
-                # Track which files use which ports
-                if var_value not in port_to_files:
-                    port_to_files[var_value] = []
-                port_to_files[var_value].append((filename, var_name))
-                all_ports.add(var_value)
-
-    # Check for cross-service port conflicts (same port used by different services)
-    for port, file_vars in port_to_files.items():
-        if len(file_vars) > 1:
-            # Check if all uses are from the same service (same config file)
-            unique_files = set(filename for filename, _ in file_vars)
-            if len(unique_files) > 1:
-                # This is a real conflict - same port used by different services
-                for filename, var_name in file_vars:
-                    port_conflicts.append((filename, var_name, port))
+                handler = HANDLERS.get(key)
+                if handler is not None:
+                    handler(state, filename, key, value)
+                elif key.endswith(PORT_VAR_SUFFIX):
+                    _check_port(state, filename, key, value)
+            elif match.group("other"):
+                line_num = content.count("\n", 0, match.start()) + 1
+                logger.warning(
+                    f"Invalid line format in {file_path}:{line_num}: "
+                    f"{match.group('other')}"
+                )
+
+        return env_vars, [
+            var for var in REQUIRED_VARS.get(filename, []) if var in missing
+        ]
+
+    except Exception as e:
+        logger.error(f"Failed to load {file_path}: {str(e)}")
+        return {}, []
+
+
+def report_ports(state: CrossComponentState) -> bool:
+    """
+    Report port configurations across all components.
+
+    Args:
+        state: Values collected from all configuration files
+
+    Returns:
+        True if all ports are valid, False otherwise
+    """
+    logger.info("Validating port configurations...")
 
     # Report invalid ports
-    if invalid_ports:
-        logger.error("❌ Invalid port configurations:")
-        for filename, var_name, var_value in invalid_ports:
-            logger.error(f"   {filename}: {var_name}={var_value}")
+    if state.invalid_ports:
+        logger.error(
+            "❌ Invalid port configurations:\n%s", "\n".join(state.invalid_ports)
+        )
         return False
 
     # Report port conflicts
-    if port_conflicts:
-        logger.error("❌ Port conflicts detected:")
-        for filename, var_name, var_value in port_conflicts:
-            logger.error(f"   {filename}: {var_name}={var_value}")
+    if state.conflicting_ports:
+        conflicts = [
+            f"   {filename}: {var_name}={port}"
+            for port, file_vars in state.port_to_files.items()
+            if port in state.conflicting_ports
+            for filename, var_name in file_vars
+        ]
+        logger.error("❌ Port conflicts detected:\n%s", "\n".join(conflicts))
         return False
 
-    logger.info(f"✅ All {len(all_ports)} ports are valid and unique")
+    logger.info(
+        "✅ All %d ports are valid and unique", len(state.port_to_files)
+    )
     return True
 
 
-def validate_database_urls(all_env_vars: Dict[str, Dict[str, str]]) -> bool:
+def report_database_urls(state: CrossComponentState) -> bool:
     """
-    Validate database connection URLs.
+    Report database connection URLs.
 
     Args:
-        all_env_vars: Dictionary mapping filenames to their env vars
+        state: Values collected from all configuration files
 
     Returns:
         True if all database URLs are valid, False otherwise
     """
     logger.info("Validating database configurations...")
 
-    db_url_pattern = re.compile(r"^jdbc:postgresql://[^:]+:\d+/\w+$")
-    invalid_urls: List[Tuple[str, str]] = []
-
-    for filename, env_vars in all_env_vars.items():
-        for var_name, var_value in env_vars.items():
-            if var_name == "EDC_DATASOURCE_DEFAULT_URL":
-                if not db_url_pattern.match(var_value):
-                    invalid_urls.append((filename, var_value))
-
-    if invalid_urls:
-        logger.error("❌ Invalid database URLs:")
-        for filename, url in invalid_urls:
-            logger.error(f"   {filename}: {url}")
+    if state.invalid_urls:
+        logger.error("❌ Invalid database URLs:\n%s", "\n".join(state.invalid_urls))
         return False
 
     logger.info("✅ All database URLs are valid")
     return True
 
 
-def validate_did_format(all_env_vars: Dict[str, Dict[str, str]]) -> bool:
+def report_did_format(state: CrossComponentState) -> bool:
     """
-    Validate DID format consistency.
+    Report DID format consistency.
 
     Args:
-        all_env_vars: Dictionary mapping filenames to their env vars
+        state: Values collected from all configuration files
 
     Returns:
         True if DIDs are valid and consistent, False otherwise
     """
     logger.info("Validating DID configurations...")
 
-    did_pattern = re.compile(r"^did:web:[^:]+(?:%3A\d+)?(?::[^:]+)?$")
-    dids: Set[str] = set()
-    invalid_dids: List[Tuple[str, str, str]] = []
-
-    for filename, env_vars in all_env_vars.items():
-        for var_name, var_value in env_vars.items():
-            if "PARTICIPANT_ID" in var_name or "IAM_ID" in var_name:
-                if not did_pattern.match(var_value):
-                    invalid_dids.append((filename, var_name, var_value))
-                else:
-                    dids.add(var_value)
-
-    if invalid_dids:
-        logger.error("❌ Invalid DID formats:")
-        for filename, var_name, var_value in invalid_dids:
-            logger.error(f"   {filename}: {var_name}={var_value}")
+    if state.invalid_dids:
+        logger.error("❌ Invalid DID formats:\n%s", "\n".join(state.invalid_dids))
         return False
 
-    if len(dids) > 1:
-        logger.error(f"❌ Inconsistent DIDs across components: {dids}")
+    if state.conflicting_did is not None:
+        logger.error(
+            f"❌ Inconsistent DIDs across components: "
+            f"{state.did} != {state.conflicting_did}"
+        )
         return False
 
-    if dids:
-        logger.info(f"✅ DID format is valid and consistent: {list(dids)[0]}")
+    if state.did is not None:
+        logger.info("✅ DID format is valid and consistent: %s", state.did)
 
     return True
 
 
-def validate_vault_configuration(all_env_vars: Dict[str, Dict[str, str]]) -> bool:
+def report_vault_configuration(state: CrossComponentState) -> bool:
     """
-    Validate Vault configuration consistency.
+    Report Vault configuration consistency.
 
     Args:
-        all_env_vars: Dictionary mapping filenames to their env vars
+        state: Values collected from all configuration files
 
     Returns:
         True if Vault config is consistent, False otherwise
     """
     logger.info("Validating Vault configurations...")
 
-    vault_urls: Set[str] = set()
-    vault_tokens: Set[str] = set()
-
-    for filename, env_vars in all_env_vars.items():
-        vault_url = env_vars.get("EDC_VAULT_HASHICORP_URL")
-        vault_token = env_vars.get("EDC_VAULT_HASHICORP_TOKEN")
-
-        if vault_url:
-            vault_urls.add(vault_url)
-        if vault_token:
-            vault_tokens.add(vault_token)
-
-    if len(vault_urls) > 1:
-        logger.error(f"❌ Inconsistent Vault URLs: {vault_urls}")
+    if state.conflicting_vault_url is not None:
+        logger.error(
+            f"❌ Inconsistent Vault URLs: "
+            f"{state.vault_url} != {state.conflicting_vault_url}"
+        )
         return False
 
-    if len(vault_tokens) > 1:
-        logger.error(f"❌ Inconsistent Vault tokens: {vault_tokens}")
+    if state.conflicting_vault_token is not None:
+        logger.error(
+            f"❌ Inconsistent Vault tokens: "
+            f"{state.vault_token} != {state.conflicting_vault_token}"
+        )
         return False
 
     logger.info("✅ Vault configuration is consistent")
     return True
 
 
+def validate_all(state: CrossComponentState) -> bool:
+    """
+    Report the cross-component validations collected while loading the files.
+
+    Ports, database URLs, DIDs and Vault settings are reported in that order.
+
+    Args:
+        state: Values collected from all configuration files
+
+    Returns:
+        True if all cross-component validations pass, False otherwise
+    """
+    # Run every report so all problems are logged, not only the first one
+    results = [
+        report_ports(state),
+        report_database_urls(state),
+        report_did_format(state),
+        report_vault_configuration(state),
+    ]
+    return all(results)
+
+
 def main():
     """Main entry point."""
     logger.info("Validating Provider Participant configuration files")
@@ -360,68 +539,76 @@ def main():
 
     config_dir = Path("config")
 
-    if not config_dir.exists():
+    # Open the config directory once; files are then stat'ed and opened by
+    # name relative to it instead of resolving the full path each time
+    try:
+        config_dir_fd = os.open(config_dir, os.O_RDONLY | os.O_DIRECTORY)
+    except (FileNotFoundError, NotADirectoryError):
         logger.error(
             "❌ Config directory not found. Run: task provider:generate-config"
         )
         return 1
 
-    # Load all configuration files
-    all_env_vars: Dict[str, Dict[str, str]] = {}
+    # Load all configuration files. Variables are checked while each file is
+    # parsed, so only the names of the loaded files are kept.
+    loaded_files: List[str] = []
+    state = CrossComponentState()
     validation_passed = True
 
-    for filename in CONFIG_FILES:
-        file_path = config_dir / filename
-
-        # Check file existence
-        if not validate_file_exists(file_path):
-            validation_passed = False
-            continue
-
-        # Load environment variables
-        env_vars = load_env_file(file_path)
-        if not env_vars:
-            logger.error(f"❌ Failed to load variables from {filename}")
-            validation_passed = False
-            continue
-
-        all_env_vars[filename] = env_vars
-
-        # Validate required variables
-        if not validate_required_variables(filename, env_vars):
-            validation_passed = False
+    try:
+        # Read all files concurrently up front. Parsing and checking stay
+        # serial and in CONFIG_FILES order, which port conflict detection and
+        # the log output rely on.
+        with ThreadPoolExecutor(max_workers=len(CONFIG_FILES)) as executor:
+            pending_reads = {
+                filename: executor.submit(
+                    read_env_file, config_dir / filename, config_dir_fd
+                )
+                for filename in CONFIG_FILES
+            }
 
-    if not all_env_vars:
+        for filename in CONFIG_FILES:
+            file_path = config_dir / filename
+
+            # Check file existence
+            if not validate_file_exists(file_path, config_dir_fd):
+                validation_passed = False
+                continue
+
+            # Load environment variables, checking them as they are parsed.
+            # The cross-component checks are only reported if every file
+            # validates, so skip them once a previous file has failed.
+            env_vars, missing = load_env_file(
+                file_path,
+                state if validation_passed else None,
+                pending_reads[filename],
+            )
+            if not env_vars:
+                logger.error(f"❌ Failed to load variables from {filename}")
+                validation_passed = False
+                continue
+
+            loaded_files.append(filename)
+
+            # Validate required variables
+            if not report_required_variables(filename, missing):
+                validation_passed = False
+    finally:
+        os.close(config_dir_fd)
+
+    if not loaded_files:
         logger.error("❌ No configuration files could be loaded")
         return 1
 
     # Cross-component validations
     if validation_passed:
-        if not validate_ports(all_env_vars):
-            validation_passed = False
-
-        if not validate_database_urls(all_env_vars):
-            validation_passed = False
-
-        if not validate_did_format(all_env_vars):
-            validation_passed = False
-
-        if not validate_vault_configuration(all_env_vars):
+        if not validate_all(state):
             validation_passed = False
 
     # Final result
     logger.info("")
     if validation_passed:
-        logger.info("🎉 All configuration validations passed!")
-        logger.info("")
-        logger.info("Configuration files are ready for deployment:")
-        for filename in CONFIG_FILES:
-            logger.info(f"  ✅ {filename}")
-        logger.info("")
-        logger.info("Next steps:")
-        logger.info("  1. Start provider services with Docker Compose")
-        logger.info("  2. Verify component health checks")
-        logger.info("  3. Test API endpoints")
+        logger.info(SUCCESS_BANNER)
         return 0
     else:
         logger.error("❌ Configuration validation failed")